@@ -1,13 +1,14 @@
 """Regulator module for ROV control (NED convention)."""
 
 import asyncio
+from collections.abc import Callable
+import math
 import time
-from typing import cast
+from typing import NamedTuple, cast
 
 import numpy as np
 from numpy.typing import NDArray
 from scipy.optimize import curve_fit
-from scipy.spatial.transform import Rotation
 
 from .constants import (
     AHRS_ACCEL_MIN_NORM,
@@ -29,6 +30,9 @@ from .constants import (
 from .log import log_error, log_info
 from .models.config import (
     AxisConfig,
+    DirectionCoefficients,
+    Power as PowerConfig,
+    Regulator as RegulatorConfig,
     RegulatorSuggestions as RegulatorSuggestionsPayload,
 )
 from .models.toast import ToastVariant
@@ -38,6 +42,96 @@ from .websocket.message import RegulatorSuggestions
 from .websocket.queue import get_message_queue
 
 
+_Quat = tuple[float, float, float, float]
+_Vec3 = tuple[float, float, float]
+
+_SMALL_ANGLE_SQ = 1e-12
+_ROTVEC_SERIES_MAX_SQ = 4e-4  # theta < 0.02 rad, the next series terms are ~1e-15
+_IDENTITY_QUAT: _Quat = (0.0, 0.0, 0.0, 1.0)
+_FAST_RENORM_TOLERANCE = 0.1
+
+_DT_NOMINAL = 1.0 / THRUSTER_SEND_FREQUENCY
+_DT_MIN = 0.5 * _DT_NOMINAL
+_DT_MAX = 10.0 * _DT_NOMINAL
+_AUTO_TUNING_TOAST_REFRESH_SECONDS = 1.0
+_AUTO_TUNING_MIN_INTERVAL = 1 / 60
+_MIN_SINUSOID_SAMPLES = 4
+# A spectral peak is used without curve fitting when it sits at least this many bins above DC (enough cycles for
+# the interpolation to be accurate) and the Hann main lobe around it holds this fraction of the non-DC power
+_SINUSOID_DIRECT_MIN_BIN = 3
+_SINUSOID_DIRECT_MIN_PEAK_FRACTION = 0.9
+# The spectrum seeds the fallback fit close to the answer, and gains derived from a noisy oscillation gain nothing
+# from more than about four significant digits, so a bad fit gives up early instead of running scipy's 1000 evaluations
+_SINE_FIT_MAX_EVALUATIONS = 100
+_SINE_FIT_TOLERANCE = 1e-4
+# Auto-tuning advances at most once per _AUTO_TUNING_MIN_INTERVAL, which bounds the oscillation samples per phase
+_AUTO_TUNING_MAX_SAMPLES = (
+    math.ceil(AUTO_TUNING_OSCILLATION_DURATION_SECONDS / _AUTO_TUNING_MIN_INTERVAL) + 2
+)
+_PITCH_MAX_RAD = math.radians(PITCH_MAX)
+_MAX_GYRO_RAD_S = math.radians(MAX_GYRO_DEG_PER_SEC)
+_INTEGRAL_WINDUP_CLIP_RAD = np.float32(math.radians(INTEGRAL_WINDUP_CLIP_DEGREES))
+_INTEGRAL_RELAX_THRESHOLD_SQ = INTEGRAL_RELAX_THRESHOLD * INTEGRAL_RELAX_THRESHOLD
+# Stabilization output is divided by 10 to avoid unsatisfying PID constant values
+_STABILIZATION_OUTPUT_SCALE = 0.1
+_AHRS_ACCEL_MIN_NORM_SQ = AHRS_ACCEL_MIN_NORM * AHRS_ACCEL_MIN_NORM
+
+# Body axes are (x=roll, y=pitch, z=yaw); the direction vector orders attitude as pitch, yaw, roll.
+_BODY_TO_PITCH_YAW_ROLL = np.array([1, 2, 0], dtype=np.intp)
+
+
+class _AxisTuningSpec(NamedTuple):
+    """Static description of one auto-tuning phase."""
+
+    axis: str  # Phase name, also the key of the tuned parameters
+    label: str  # Capitalized axis name for logs
+    output_index: int  # Direction vector element driven during the phase
+    zero_threshold: float
+    amplitude_threshold: float
+    next_phase: str
+    pitch_compensation: bool  # Hold pitch with a P term while exciting the axis
+    measure: Callable[
+        [RovState], tuple[float, float]
+    ]  # (error from target, recorded sample)
+
+
+_AUTO_TUNING_SPECS: dict[str, _AxisTuningSpec] = {
+    "pitch": _AxisTuningSpec(
+        axis="pitch",
+        label="Pitch",
+        output_index=3,
+        zero_threshold=AUTO_TUNING_ZERO_THRESHOLD_DEGREES,
+        amplitude_threshold=AUTO_TUNING_AMPLITUDE_THRESHOLD_DEGREES,
+        next_phase="roll",
+        pitch_compensation=False,
+        measure=lambda state: (state.regulator.pitch, state.regulator.pitch),
+    ),
+    "roll": _AxisTuningSpec(
+        axis="roll",
+        label="Roll",
+        output_index=5,
+        zero_threshold=AUTO_TUNING_ZERO_THRESHOLD_DEGREES,
+        amplitude_threshold=AUTO_TUNING_AMPLITUDE_THRESHOLD_DEGREES,
+        next_phase="depth",
+        pitch_compensation=True,
+        measure=lambda state: (state.regulator.roll, state.regulator.roll),
+    ),
+    "depth": _AxisTuningSpec(
+        axis="depth",
+        label="Depth",
+        output_index=2,
+        zero_threshold=AUTO_TUNING_ZERO_THRESHOLD_DEPTH_METERS,
+        amplitude_threshold=AUTO_TUNING_AMPLITUDE_THRESHOLD_DEPTH_METERS,
+        next_phase="done",
+        pitch_compensation=False,
+        measure=lambda state: (
+            state.pressure.depth - state.regulator.desired_depth,
+            state.pressure.depth,
+        ),
+    ),
+}
+
+
 def _clamp_dt(dt: float) -> float:
     """Clamp a time step to a safe range around the thruster send interval.
 
@@ -50,16 +144,93 @@ def _clamp_dt(dt: float) -> float:
     Returns:
         float: Clamped time delta in seconds.
     """
-    if not np.isfinite(dt):
-        return 1 / THRUSTER_SEND_FREQUENCY
-    return cast(
-        float,
-        np.clip(
-            dt,
-            (1 / THRUSTER_SEND_FREQUENCY) * 0.5,
-            (1 / THRUSTER_SEND_FREQUENCY) * 10,
-            dtype=np.float32,
-        ),
+    if not math.isfinite(dt):
+        return _DT_NOMINAL
+    if dt < _DT_MIN:
+        return _DT_MIN
+    if dt > _DT_MAX:
+        return _DT_MAX
+    return dt
+
+
+def _quat_mul(a: _Quat, b: _Quat) -> _Quat:
+    """Hamilton product a * b of two (x, y, z, w) quaternions.
+
+    Matches Rotation composition: applying the result is applying b, then a.
+    """
+    ax, ay, az, aw = a
+    bx, by, bz, bw = b
+    return (
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+        aw * bw - ax * bx - ay * by - az * bz,
+    )
+
+
+def _rotvec_to_quat(rotvec: _Vec3) -> _Quat:
+    """Convert a rotation vector (axis * angle in radians) to a (x, y, z, w) quaternion.
+
+    Per-sample gyro rotations are a few hundredths of a radian, so angles below _ROTVEC_SERIES_MAX_SQ use the
+    fourth-order series of sin(theta / 2) / theta and cos(theta / 2). That skips sqrt/sin/cos, avoids dividing by
+    ~0, and the truncation error stays below double precision.
+    """
+    rx, ry, rz = rotvec
+    theta_sq = rx * rx + ry * ry + rz * rz
+    if theta_sq < _ROTVEC_SERIES_MAX_SQ:
+        theta_4 = theta_sq * theta_sq
+        scale = 0.5 - theta_sq / 48.0 + theta_4 / 3840.0
+        w = 1.0 - theta_sq / 8.0 + theta_4 / 384.0
+    else:
+        theta = math.sqrt(theta_sq)
+        scale = math.sin(0.5 * theta) / theta
+        w = math.cos(0.5 * theta)
+    return (rx * scale, ry * scale, rz * scale, w)
+
+
+def _quat_to_rotvec(q: _Quat) -> _Vec3:
+    """Convert a unit (x, y, z, w) quaternion to the shortest rotation vector (axis * angle in radians).
+
+    Same as Rotation.as_rotvec: the quaternion is flipped to w >= 0 so the angle is in [0, pi], and small angles use a
+    Taylor expansion of angle / sin(angle / 2).
+    """
+    x, y, z, w = q
+    if w < 0.0:
+        x, y, z, w = -x, -y, -z, -w
+    sin_half = math.sqrt(x * x + y * y + z * z)
+    angle = 2.0 * math.atan2(sin_half, w)
+    angle_sq = angle * angle
+    scale = 2.0 + angle_sq / 12.0 if angle_sq < _SMALL_ANGLE_SQ else angle / sin_half
+    return (x * scale, y * scale, z * scale)
+
+
+def _quat_to_euler_zyx(q: _Quat) -> _Vec3:
+    """Decompose a unit (x, y, z, w) quaternion into intrinsic ZYX Euler angles.
+
+    Returns:
+        tuple[float, float, float]: (yaw, pitch, roll) in radians, same as Rotation.as_euler("ZYX").
+    """
+    x, y, z, w = q
+    yaw = math.atan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+    sin_pitch = 2.0 * (w * y - z * x)
+    pitch = math.asin(max(-1.0, min(1.0, sin_pitch)))
+    roll = math.atan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y))
+    return (yaw, pitch, roll)
+
+
+def _euler_zyx_to_quat(yaw: float, pitch: float, roll: float) -> _Quat:
+    """Build a (x, y, z, w) quaternion from intrinsic ZYX Euler angles in radians.
+
+    Inverse of _quat_to_euler_zyx, same as Rotation.from_euler("ZYX", [yaw, pitch, roll]).
+    """
+    cy, sy = math.cos(0.5 * yaw), math.sin(0.5 * yaw)
+    cp, sp = math.cos(0.5 * pitch), math.sin(0.5 * pitch)
+    cr, sr = math.cos(0.5 * roll), math.sin(0.5 * roll)
+    return (
+        sr * cp * cy - cr * sp * sy,
+        cr * sp * cy + sr * cp * sy,
+        cr * cp * sy - sr * sp * cy,
+        cr * cp * cy + sr * sp * sy,
     )
 
 
@@ -68,8 +239,11 @@ class _MahonyAhrs:
 
     - Stabilizes roll/pitch with accel (gravity).
     - Yaw is integrated from gyro (will drift without external heading reference).
+    - The attitude is kept as a plain float64 (x, y, z, w) quaternion to avoid Rotation allocations per sample.
     """
 
+    __slots__ = ("_integral", "ki", "kp", "quaternion", "version")
+
     def __init__(self, kp: float, ki: float) -> None:
         """Create a Mahony AHRS estimator configured with the given proportional and integral gains.
 
@@ -83,7 +257,10 @@ class _MahonyAhrs:
         self.kp: float = float(kp)
         self.ki: float = float(ki)
         self._integral: NDArray[np.float32] = np.zeros(3, dtype=np.float32)
-        self.current_attitude: Rotation = Rotation.identity()
+        self.quaternion: NDArray[np.float64] = np.array(
+            _IDENTITY_QUAT, dtype=np.float64
+        )  # Body-to-world attitude (x, y, z, w)
+        self.version: int = 0  # Incremented whenever the quaternion changes, lets callers cache derived values
 
     def reset(self) -> None:
         """Reset the AHRS internal state to its initial condition.
@@ -91,7 +268,8 @@ class _MahonyAhrs:
         Sets the integral error accumulator to zero and the estimated attitude to the identity rotation (no rotation).
         """
         self._integral[:] = 0.0
-        self.current_attitude = Rotation.identity()
+        self.quaternion[:] = _IDENTITY_QUAT
+        self.version += 1
 
     def update(
         self,
@@ -101,7 +279,7 @@ class _MahonyAhrs:
     ) -> None:
         """Update internal attitude estimate from gyroscope and accelerometer readings.
 
-        Clamps the provided time step, rejects unreasonably large gyro samples (zeroing them),
+        Clamps the provided time step, rejects unreasonably large gyro samples (using zero rates without modifying the input),
         and uses the Mahony AHRS update: when accelerometer data is valid the method applies
         proportional and integral corrections based on the measured gravity direction; if the
         accelerometer norm is invalid or too small it falls back to gyro-only integration.
@@ -114,80 +292,149 @@ class _MahonyAhrs:
         """
         dt = _clamp_dt(dt)
 
+        gx, gy, gz = cast(list[float], gyro_rad_s.tolist())
+
         # Discard gyro reading if unreasonable big
-        if np.any(
-            cast(NDArray[np.float32], np.abs(gyro_rad_s, dtype=np.float32))
-            > cast(np.float32, np.deg2rad(MAX_GYRO_DEG_PER_SEC, dtype=np.float32))
+        if (
+            abs(gx) > _MAX_GYRO_RAD_S
+            or abs(gy) > _MAX_GYRO_RAD_S
+            or abs(gz) > _MAX_GYRO_RAD_S
         ):
             log_error("AHRS: Discarding unreasonable gyro reading")
-            gyro_rad_s[:] = 0.0
+            gx = gy = gz = 0.0
 
-        ax, ay, az = cast(float, accel[0]), cast(float, accel[1]), cast(float, accel[2])
-        a_norm = cast(float, np.sqrt(ax * ax + ay * ay + az * az))
-        if not np.isfinite(a_norm) or a_norm < AHRS_ACCEL_MIN_NORM:
-            self._integrate_gyro_only(gyro_rad_s, dt)
+        ax, ay, az = cast(list[float], accel.tolist())
+        a_norm_sq = ax * ax + ay * ay + az * az
+        if not math.isfinite(a_norm_sq) or a_norm_sq < _AHRS_ACCEL_MIN_NORM_SQ:
+            self._integrate_omega((gx, gy, gz), dt)
             return
 
-        a = cast(
-            NDArray[np.float32], np.array([ax, ay, az], dtype=np.float32) / a_norm
-        )  # Normalized accel measurement
+        inv_a_norm = 1.0 / math.sqrt(a_norm_sq)
+        ax *= inv_a_norm  # Normalized accel
+        ay *= inv_a_norm
+        az *= inv_a_norm
 
         # Estimated "up" direction in body frame from current attitude (the reason we use up is that this is the expected accel from gravity).
-        g_body = cast(
-            NDArray[np.float32],
-            self.current_attitude.inv().apply(
-                np.array([0.0, 0.0, -1.0], dtype=np.float32)
-            ),
-        )
-
-        # Error drives estimated up toward measured accel direction.
-        e = np.cross(a, g_body)
-
+        # Rotating the constant (0, 0, -1) into the body frame is minus the third row of the body-to-world DCM.
+        x, y, z, w = cast(list[float], self.quaternion.tolist())
+        ux = 2.0 * (w * y - x * z)
+        uy = -2.0 * (y * z + w * x)
+        uz = 2.0 * (x * x + y * y) - 1.0
+
+        # Error drives estimated up toward measured accel direction (cross product a x up).
+        ex = ay * uz - az * uy
+        ey = az * ux - ax * uz
+        ez = ax * uy - ay * ux
+
+        ix, iy, iz = cast(list[float], self._integral.tolist())
         if self.ki > 0.0:
-            self._integral += e * (self.ki * dt)
-
-        omega = np.array(
-            [
-                gyro_rad_s[0] + self.kp * e[0] + self._integral[0],
-                gyro_rad_s[1] + self.kp * e[1] + self._integral[1],
-                gyro_rad_s[2] + self.kp * e[2] + self._integral[2],
-            ],
-            dtype=np.float32,
-        )
-
-        self._integrate_omega(omega, dt)
-
-    def _integrate_gyro_only(self, gyro_rad_s: NDArray[np.float32], dt: float) -> None:
-        """Advance the internal attitude estimate by integrating gyro angular rates only.
-
-        Parameters:
-            gyro_rad_s (NDArray[np.float32]): Angular velocity vector [rad/s] in body frame (gx, gy, gz).
-            dt (float): Time step in seconds over which to integrate.
-        """
-        omega = np.array(
-            [gyro_rad_s[0], gyro_rad_s[1], gyro_rad_s[2]],
-            dtype=np.float32,
+            ki_dt = self.ki * dt
+            ix += ex * ki_dt
+            iy += ey * ki_dt
+            iz += ez * ki_dt
+            self._integral[:] = (ix, iy, iz)
+
+        kp = self.kp
+        self._integrate_omega(
+            (gx + kp * ex + ix, gy + kp * ey + iy, gz + kp * ez + iz), dt
         )
-        self._integrate_omega(omega, dt)
 
-    def _integrate_omega(self, omega_rad_s: NDArray[np.float32], dt: float) -> None:
+    def _integrate_omega(self, omega_rad_s: _Vec3, dt: float) -> None:
         """Integrates an angular velocity vector over a time step and updates the current attitude quaternion.
 
         Parameters:
-            omega_rad_s (NDArray[np.float32]): Angular velocity vector in radians per second (rotation vector in body frame).
+            omega_rad_s (tuple[float, float, float]): Angular velocity vector in radians per second (rotation vector in body frame).
             dt (float): Time step in seconds.
 
         Details:
-            - Applies the rotation represented by omega_rad_s * dt to self.current_attitude.
-            - Normalizes the resulting quaternion to unit length and stores it back to self.current_attitude.
+            - Applies the rotation represented by omega_rad_s * dt to the attitude quaternion.
+            - Normalizes the resulting quaternion to unit length and stores it back in place.
         """
-        dtheta = omega_rad_s * dt
-        dr = Rotation.from_rotvec(dtheta)
-        self.current_attitude = self.current_attitude * dr  # body-to-world update
+        wx, wy, wz = omega_rad_s
+        dq = _rotvec_to_quat((wx * dt, wy * dt, wz * dt))
+        q = cast(_Quat, tuple(self.quaternion.tolist()))
+        x, y, z, w = _quat_mul(q, dq)  # body-to-world update
+
+        # The quaternion stays near unit length after a small update, so a first-order
+        # Newton step 0.5 * (3 - |q|^2) renormalizes it without a sqrt. Fall back to the
+        # exact norm if it has drifted far (e.g. after an externally set attitude).
+        norm_sq = x * x + y * y + z * z + w * w
+        if abs(norm_sq - 1.0) < _FAST_RENORM_TOLERANCE:
+            scale = 0.5 * (3.0 - norm_sq)
+        else:
+            scale = 1.0 / math.sqrt(norm_sq)
+        self.quaternion[:] = (x * scale, y * scale, z * scale, w * scale)
+        self.version += 1
+
+
+class _SinusoidEstimate(NamedTuple):
+    """Dominant sinusoid amplitude * sin(2 * pi * frequency * (t - t0) + phase) + offset found by _estimate_sinusoid."""
+
+    amplitude: float
+    frequency: float  # Hz
+    phase: float  # Radians
+    offset: float
+    prominent: bool  # Peak is clean enough to use without a curve fit
+
+
+def _estimate_sinusoid(
+    times: NDArray[np.float64], values: NDArray[np.float64]
+) -> _SinusoidEstimate | None:
+    """Estimate the dominant sinusoid in unevenly spaced samples from a Hann-windowed FFT.
+
+    The samples are resampled onto an even grid spanning the same time range and the largest non-DC rfft bin is
+    refined by a parabola through the log magnitudes of it and its neighbours. The fractional bin offset then corrects
+    the amplitude for the Hann response and the phase for the window's linear phase.
+
+    Parameters:
+        times (NDArray[np.float64]): Increasing sample times in seconds.
+        values (NDArray[np.float64]): Sample values.
 
-        q = cast(NDArray[np.float32], self.current_attitude.as_quat())
-        q /= np.linalg.norm(q)
-        self.current_attitude = Rotation.from_quat(q)
+    Returns:
+        _SinusoidEstimate | None: The estimate, or None with too few samples or no time span.
+    """
+    n = times.size
+    if n < _MIN_SINUSOID_SAMPLES:
+        return None
+    start = float(times[0])
+    duration = float(times[-1]) - start
+    if duration <= 0.0:
+        return None
+
+    grid = np.linspace(start, start + duration, n)
+    uniform = np.interp(grid, times, values)
+    offset = float(np.mean(uniform))
+    window = np.hanning(n)
+    spectrum = np.fft.rfft((uniform - offset) * window)
+    magnitude = np.abs(spectrum)
+    k = 1 + int(np.argmax(magnitude[1:]))
+    peak = float(magnitude[k])
+
+    delta = 0.0
+    if 1 < k < magnitude.size - 1 and peak > 0.0:
+        left = math.log(max(float(magnitude[k - 1]), 1e-300))
+        center = math.log(peak)
+        right = math.log(max(float(magnitude[k + 1]), 1e-300))
+        curvature = left - 2.0 * center + right
+        if curvature < 0.0:
+            delta = min(max(0.5 * (left - right) / curvature, -0.5), 0.5)
+
+    frequency = (k + delta) * (n - 1) / (n * duration)
+    # The Hann response at delta bins off-peak is sinc(delta) / (1 - delta^2) of the on-bin peak
+    hann_response = float(np.sinc(delta)) / (1.0 - delta * delta)
+    amplitude = 2.0 * peak / (float(np.sum(window)) * hann_response)
+    # sin lags the DFT's cosine basis by pi / 2, and the window centre adds pi * delta * (n - 1) / n
+    phase = float(np.angle(spectrum[k])) + 0.5 * math.pi - math.pi * delta * (n - 1) / n
+
+    power = magnitude[1:] * magnitude[1:]
+    total_power = float(np.sum(power))
+    lobe_power = float(np.sum(power[max(k - 3, 0) : k + 2]))
+    prominent = (
+        k >= _SINUSOID_DIRECT_MIN_BIN
+        and total_power > 0.0
+        and lobe_power >= _SINUSOID_DIRECT_MIN_PEAK_FRACTION * total_power
+    )
+    return _SinusoidEstimate(amplitude, frequency, phase, offset, prominent)
 
 
 class Regulator:
@@ -205,39 +452,57 @@ class Regulator:
             [0.0, 0.0, 0.0], dtype=np.float32
         )  # rad/s
         self._accel_buffer: NDArray[np.float32] = np.zeros(3, dtype=np.float32)
-        self._gyro_buffer: NDArray[np.float32] = np.zeros(3, dtype=np.float32)
         self._regulator_direction_vector: NDArray[np.float32] = np.zeros(
             8, dtype=np.float32
         )
         self._unlimited_direction_vector: NDArray[np.float32] = np.zeros(
             8, dtype=np.float32
         )
-        self._depth_hold_vector_buffer: NDArray[np.float32] = np.zeros(
+        self._stabilization_actuation_buffer: NDArray[np.float32] = np.zeros(
             3, dtype=np.float32
         )
-        self._movement_vector_buffer: NDArray[np.float32] = np.zeros(
+        self._stabilization_pid_buffer: NDArray[np.float32] = np.zeros(
             3, dtype=np.float32
         )
-        self._stabilization_input_buffer: NDArray[np.float32] = np.zeros(
+        self._stabilization_error_buffer: NDArray[np.float32] = np.zeros(
             3, dtype=np.float32
         )
-        self._stabilization_actuation_buffer: NDArray[np.float32] = np.zeros(
-            3, dtype=np.float32
+        # Per-axis gains in body axis order (roll, pitch, yaw) with _STABILIZATION_OUTPUT_SCALE folded in, refreshed when the config changes
+        self._stabilization_kp: NDArray[np.float32] = np.zeros(3, dtype=np.float32)
+        self._stabilization_ki: NDArray[np.float32] = np.zeros(3, dtype=np.float32)
+        self._stabilization_kd: NDArray[np.float32] = np.zeros(3, dtype=np.float32)
+        # (1 / kp, 1 / ki) per axis of the scaled gains for back-calculation, (0, 0) where either gain is 0
+        self._stabilization_tracking: list[tuple[float, float]] = [(0.0, 0.0)] * 3
+        self._stabilization_gains_config: RegulatorConfig | None = None
+        self._pitch_hold_gain: float = (
+            0.0  # P gain holding pitch level while roll is auto-tuned
         )
-        self._unit_vectors: NDArray[np.float32] = np.eye(3, dtype=np.float32)
+        # Per-element user power scale (thrusters 0-5, actions 6-7), refreshed when the power config changes
+        self._user_power_scale: NDArray[np.float32] = np.ones(8, dtype=np.float32)
+        self._user_power_scale_config: PowerConfig | None = None
+        self._body_transform: NDArray[np.float32] = np.eye(3, dtype=np.float32)
+        self._body_transform_version: int = -1
+        # Cross-axis direction coefficient ratios, and the body transform with them folded in
+        self._movement_ratios: NDArray[np.float32] = np.ones((3, 3), dtype=np.float32)
+        self._movement_ratios_config: DirectionCoefficients | None = None
+        self._movement_transform: NDArray[np.float32] = np.eye(3, dtype=np.float32)
+        self._movement_transform_version: int = -1
         self._world_frame_movement_buffer: NDArray[np.float32] = np.zeros(
             3, dtype=np.float32
         )
 
-        self.last_update_ahrs_time: float = 0.0
+        # Monotonic timestamps (ns) so wall-clock adjustments never show up as time steps, 0 means not yet run
+        self.last_update_ahrs_ns: int = 0
         self.delta_t_update_ahrs: float = 1 / THRUSTER_SEND_FREQUENCY
-        self.last_run_regulator_time: float = 0.0
+        self.last_run_regulator_ns: int = 0
         self.delta_t_run_regulator: float = 1 / THRUSTER_SEND_FREQUENCY
 
         # Quaternion attitude estimator
         self.ahrs: _MahonyAhrs = _MahonyAhrs(kp=AHRS_MAHONY_KP, ki=AHRS_MAHONY_KI)
 
-        self.desired_attitude: Rotation = Rotation.identity()
+        self.desired_quaternion: NDArray[np.float64] = np.array(
+            _IDENTITY_QUAT, dtype=np.float64
+        )  # Desired body-to-world attitude (x, y, z, w)
         self.integral_attitude_rad: NDArray[np.float32] = np.array(
             [0.0, 0.0, 0.0], dtype=np.float32
         )
@@ -249,12 +514,23 @@ class Regulator:
 
         self.auto_tuning_phase: str = ""
         self.auto_tuning_step: str = ""
-        self.auto_tuning_data: list[tuple[float, float]] = []
+        # Oscillation samples (seconds since the oscillation started, measured value), filled up to auto_tuning_sample_count
+        self.auto_tuning_times: NDArray[np.float32] = np.zeros(
+            _AUTO_TUNING_MAX_SAMPLES, dtype=np.float32
+        )
+        self.auto_tuning_values: NDArray[np.float32] = np.zeros(
+            _AUTO_TUNING_MAX_SAMPLES, dtype=np.float32
+        )
+        self.auto_tuning_sample_count: int = 0
+        self.auto_tuning_last_sample: float = 0.0
         self.auto_tuning_params: dict[str, AxisConfig] = {}
         self.auto_tuning_last_update: float = 0.0
         self.auto_tuning_zero_actuation: float = 0.0
         self.auto_tuning_amplitude: float = 0.0
         self.auto_tuning_oscillation_start: float = 0.0
+        self._auto_tuning_output: NDArray[np.float32] = np.zeros(8, dtype=np.float32)
+        self._auto_tuning_toast_key: tuple[str, str, int | None] | None = None
+        self._auto_tuning_toast_time: float = 0.0
 
     def _update_desired_from_direction_vector(
         self, direction_vector: NDArray[np.float32]
@@ -264,7 +540,7 @@ class Regulator:
         When depth hold is enabled, adjusts state.regulator.desired_depth by the heave input
         (direction_vector[2]) scaled by the configured depth_rate and the regulator
         delta-time. When pitch stabilization is enabled, applies yaw, pitch, and roll increments
-        (from direction_vector[4], [3], [5] respectively) to self.desired_attitude using
+        (from direction_vector[4], [3], [5] respectively) to self.desired_quaternion using
         quaternion operations, clamps pitch to ±PITCH_MAX to avoid gimbal issues, and writes
         desired pitch and roll into state.regulator for UI visualization.
 
@@ -284,79 +560,54 @@ class Regulator:
             self.state.regulator.desired_depth = desired_depth
 
         if self.state.system_status.auto_stabilization:
-            if not self.state.rov_config.regulator.fpv_mode:
-                desired_yaw_change = cast(
-                    float,
-                    direction_vector[4]
-                    * self.delta_t_run_regulator
-                    * self.state.rov_config.regulator.yaw.rate,
-                )
-                yaw_rotation = Rotation.from_rotvec(
-                    [0.0, 0.0, np.deg2rad(desired_yaw_change, dtype=np.float32)]
-                )
-                self.desired_attitude = yaw_rotation * self.desired_attitude
-
-                desired_pitch_change = cast(
-                    float,
-                    direction_vector[3]
-                    * self.delta_t_run_regulator
-                    * self.state.rov_config.regulator.pitch.rate,
-                )
-                yaw, pitch, roll = cast(
-                    tuple[float, float, float],
-                    self.desired_attitude.as_euler("ZYX", degrees=True),
-                )
-                pitch = pitch + desired_pitch_change
-                pitch = cast(
-                    float, np.clip(pitch, -PITCH_MAX, PITCH_MAX, dtype=np.float32)
-                )
-                self.desired_attitude = Rotation.from_euler(
-                    "ZYX", [yaw, pitch, roll], degrees=True
-                )
+            desired_yaw_change = float(
+                direction_vector[4]
+                * self.delta_t_run_regulator
+                * self.state.rov_config.regulator.yaw.rate
+            )
+            desired_pitch_change = float(
+                direction_vector[3]
+                * self.delta_t_run_regulator
+                * self.state.rov_config.regulator.pitch.rate
+            )
+            desired_roll_change = float(
+                direction_vector[5]
+                * self.delta_t_run_regulator
+                * self.state.rov_config.regulator.roll.rate
+            )
+            q = cast(_Quat, tuple(self.desired_quaternion.tolist()))
 
-                desired_roll_change = cast(
-                    float,
-                    direction_vector[5]
-                    * self.delta_t_run_regulator
-                    * self.state.rov_config.regulator.roll.rate,
-                )
-                roll_rotation = Rotation.from_rotvec(
-                    [np.deg2rad(desired_roll_change, dtype=np.float32), 0.0, 0.0]
-                )
-                self.desired_attitude = self.desired_attitude * roll_rotation
-
-            if self.state.rov_config.regulator.fpv_mode:
-                desired_yaw_change = cast(
-                    float,
-                    direction_vector[4]
-                    * self.delta_t_run_regulator
-                    * self.state.rov_config.regulator.yaw.rate,
-                )
-                desired_pitch_change = cast(
-                    float,
-                    direction_vector[3]
-                    * self.delta_t_run_regulator
-                    * self.state.rov_config.regulator.pitch.rate,
+            if not self.state.rov_config.regulator.fpv_mode:
+                # A world-frame yaw rotation on the left and a body-frame roll rotation on the
+                # right of Rz(yaw) * Ry(pitch) * Rx(roll) are plain additions to the ZYX angles,
+                # so decompose once, add the changes (clamping pitch) and rebuild. With pitch
+                # inside ±PITCH_MAX the wrapped angles are exactly what decomposing the rebuilt
+                # quaternion would give, so they are published directly.
+                yaw, pitch, roll = _quat_to_euler_zyx(q)
+                yaw = math.remainder(yaw + math.radians(desired_yaw_change), math.tau)
+                pitch = min(
+                    max(pitch + math.radians(desired_pitch_change), -_PITCH_MAX_RAD),
+                    _PITCH_MAX_RAD,
                 )
-                desired_roll_change = cast(
-                    float,
-                    direction_vector[5]
-                    * self.delta_t_run_regulator
-                    * self.state.rov_config.regulator.roll.rate,
+                roll = math.remainder(
+                    roll + math.radians(desired_roll_change), math.tau
                 )
-                local_rotation = Rotation.from_rotvec(
-                    [
-                        np.deg2rad(desired_roll_change, dtype=np.float32),
-                        np.deg2rad(desired_pitch_change, dtype=np.float32),
-                        np.deg2rad(desired_yaw_change, dtype=np.float32),
-                    ]
+                self.desired_quaternion[:] = _euler_zyx_to_quat(yaw, pitch, roll)
+            else:
+                local_rotation = _rotvec_to_quat(
+                    (
+                        math.radians(desired_roll_change),
+                        math.radians(desired_pitch_change),
+                        math.radians(desired_yaw_change),
+                    )
                 )
-                self.desired_attitude = self.desired_attitude * local_rotation
+                q = _quat_mul(q, local_rotation)
+                self.desired_quaternion[:] = q
+                yaw, pitch, roll = _quat_to_euler_zyx(q)
 
-            yaw, pitch, roll = self.desired_attitude.as_euler("ZYX", degrees=True)
-            self.state.regulator.desired_pitch = pitch
-            self.state.regulator.desired_roll = roll
-            self.state.regulator.desired_yaw = yaw
+            self.state.regulator.desired_pitch = math.degrees(pitch)
+            self.state.regulator.desired_roll = math.degrees(roll)
+            self.state.regulator.desired_yaw = math.degrees(yaw)
 
     def update_regulator_data_from_imu(self) -> None:
         """Update internal AHRS and regulator fields from the IMU and write current attitude to state for visualization.
@@ -369,25 +620,28 @@ class Regulator:
         imu_data = self.state.imu
         accel = self._accel_buffer
         accel[:] = imu_data.acceleration
-        gyr = self._gyro_buffer
+        # The AHRS only reads the gyro, so the regulator's copy is passed straight in
+        gyr = self.gyro_rad_s
         gyr[:] = imu_data.gyroscope
 
-        self.gyro_rad_s[:] = gyr
-
-        now = time.time()
-        if self.last_update_ahrs_time > 0.0:
-            self.delta_t_update_ahrs = _clamp_dt(now - self.last_update_ahrs_time)
+        now_ns = time.monotonic_ns()
+        if self.last_update_ahrs_ns > 0:
+            self.delta_t_update_ahrs = _clamp_dt(
+                (now_ns - self.last_update_ahrs_ns) * 1e-9
+            )
         else:
-            self.delta_t_update_ahrs = 1 / THRUSTER_SEND_FREQUENCY
-        self.last_update_ahrs_time = now
+            self.delta_t_update_ahrs = _DT_NOMINAL
+        self.last_update_ahrs_ns = now_ns
 
         self.ahrs.update(gyr, accel, self.delta_t_update_ahrs)
 
-        yaw, pitch, roll = self.ahrs.current_attitude.as_euler("ZYX", degrees=True)
+        yaw, pitch, roll = _quat_to_euler_zyx(
+            cast(_Quat, tuple(self.ahrs.quaternion.tolist()))
+        )
 
-        self.state.regulator.pitch = pitch
-        self.state.regulator.roll = roll
-        self.state.regulator.yaw = yaw
+        self.state.regulator.pitch = math.degrees(pitch)
+        self.state.regulator.roll = math.degrees(roll)
+        self.state.regulator.yaw = math.degrees(yaw)
 
     async def imu_update_loop(self) -> None:
         """Update attitude continuously, independently of the MCU connection."""
@@ -435,161 +689,235 @@ class Regulator:
         Returns:
             float: Depth regulator actuation; positive values command upward (reduce depth), negative values command downward.
         """
-        current_depth = self.state.pressure.depth
-        desired_depth = self.state.regulator.desired_depth
-
-        error = desired_depth - current_depth
-
-        integral_scale = cast(
-            np.float32,
-            np.clip((1.0 - abs(heave_input)), 0.0, 1.0, dtype=np.float32),
-        )
-        self.integral_depth += float(
-            error * self.delta_t_run_regulator * integral_scale
-        )
+        pressure = self.state.pressure
+        error = self.state.regulator.desired_depth - pressure.depth
 
-        self.integral_depth = np.clip(
-            self.integral_depth,
-            -DEPTH_INTEGRAL_WINDUP_CLIP,
-            DEPTH_INTEGRAL_WINDUP_CLIP,
-            dtype=np.float32,
+        # |heave_input| >= 0, so only the lower bound of the [0, 1] scale can be crossed
+        integral_scale = max(1.0 - abs(float(heave_input)), 0.0)
+        integral_depth = (
+            self.integral_depth + error * self.delta_t_run_regulator * integral_scale
         )
-
-        config = self.state.rov_config.regulator
+        if integral_depth > DEPTH_INTEGRAL_WINDUP_CLIP:
+            integral_depth = DEPTH_INTEGRAL_WINDUP_CLIP
+        elif integral_depth < -DEPTH_INTEGRAL_WINDUP_CLIP:
+            integral_depth = -DEPTH_INTEGRAL_WINDUP_CLIP
+        self.integral_depth = integral_depth
+
+        # Config and sensor fields are plain Python floats, so this stays in scalar arithmetic
+        gains = self.state.rov_config.regulator.depth
         depth_regulator_actuation = (
-            float(config.depth.kp) * error
-            + float(config.depth.ki) * float(self.integral_depth)
-            - float(config.depth.kd) * self.state.pressure.depth_change
+            gains.kp * error
+            + gains.ki * integral_depth
+            - gains.kd * pressure.depth_change
         )
 
+        # Back-calculation anti-windup with Tt = max(kp / ki, dt), see _handle_stabilization
+        limit = float(self.state.rov_config.power.regulator_limit) / 100.0
+        if abs(depth_regulator_actuation) > limit and gains.ki > 0.0 and gains.kp > 0.0:
+            tracking_gain = min(self.delta_t_run_regulator / gains.kp, 1.0 / gains.ki)
+            self.integral_depth += tracking_gain * (
+                math.copysign(limit, depth_regulator_actuation)
+                - depth_regulator_actuation
+            )
+
         return depth_regulator_actuation
 
     def _attitude_enable_edge(self) -> None:
         """Set the target attitude to level (zero pitch and roll) while preserving the current yaw, and reset the attitude integral term.
 
-        This updates `desired_attitude` so pitch and roll are zero and the yaw equals the AHRS's current yaw, then clears `integral_attitude_rad`.
+        This updates `desired_quaternion` so pitch and roll are zero and the yaw equals the AHRS's current yaw, then clears `integral_attitude_rad`.
         """
-        self.desired_attitude = Rotation.identity()
-        current_yaw = self.ahrs.current_attitude.as_euler("ZYX", degrees=False)[0]
-        yaw_rotation = Rotation.from_rotvec([0.0, 0.0, current_yaw])
-        self.desired_attitude = yaw_rotation * self.desired_attitude
+        current_yaw, _pitch, _roll = _quat_to_euler_zyx(
+            cast(_Quat, tuple(self.ahrs.quaternion.tolist()))
+        )
+        self.desired_quaternion[:] = (
+            0.0,
+            0.0,
+            math.sin(0.5 * current_yaw),
+            math.cos(0.5 * current_yaw),
+        )
 
         self.integral_attitude_rad[:] = 0.0
 
+    def _refresh_stabilization_gains(self) -> None:
+        """Copy the roll/pitch/yaw PID gains, pre-multiplied by the stabilization output scale, into the per-axis gain arrays (and the auto-tuning pitch hold gain) when the regulator config object changes.
+
+        Config updates replace state.rov_config as a whole, so comparing the regulator config by identity is enough to
+        notice them without re-reading nine attributes every tick.
+        """
+        config = self.state.rov_config.regulator
+        if config is self._stabilization_gains_config:
+            return
+        scale = _STABILIZATION_OUTPUT_SCALE
+        self._stabilization_kp[:] = (config.roll.kp, config.pitch.kp, config.yaw.kp)
+        self._stabilization_kp *= scale
+        self._stabilization_ki[:] = (config.roll.ki, config.pitch.ki, config.yaw.ki)
+        self._stabilization_ki *= scale
+        self._stabilization_kd[:] = (config.roll.kd, config.pitch.kd, config.yaw.kd)
+        self._stabilization_kd *= scale
+        self._stabilization_tracking = [
+            (1.0 / (axis.kp * scale), 1.0 / (axis.ki * scale))
+            if axis.kp > 0.0 and axis.ki > 0.0
+            else (0.0, 0.0)
+            for axis in (config.roll, config.pitch, config.yaw)
+        ]
+        self._pitch_hold_gain = 0.5 * config.pitch.kp
+        self._stabilization_gains_config = config
+
     def _handle_stabilization(
         self, direction_vector_attitude: NDArray[np.float32]
     ) -> NDArray[np.float32]:
         """Compute a quaternion-based PID stabilization actuation for attitude.
 
         Parameters:
-            direction_vector_attitude (ndarray): 3-element array of user attitude inputs (pitch, yaw, roll) in body frame; when its magnitude is above the integral-relax threshold the attitude integral term is not accumulated.
+            direction_vector_attitude (ndarray): 3-element array of user attitude inputs (pitch, yaw, roll) in body frame; when its magnitude is above the integral-relax threshold the attitude integral term is not accumulated. Only read, so a view into the direction vector may be passed.
 
         Returns:
             ndarray: 3-element float32 array [pitch_actuation, yaw_actuation, roll_actuation] containing the PID actuation for each attitude axis (already scaled down for safe application).
         """
         dt = self.delta_t_run_regulator
-        config = self.state.rov_config.regulator
 
-        current_attitude: Rotation = self.ahrs.current_attitude
-        desired_attitude: Rotation = self.desired_attitude
-
-        r_err = current_attitude.inv() * desired_attitude
-
-        err_rotvec = cast(NDArray[np.float32], r_err.as_rotvec().astype(np.float32))
-        if not np.all(np.isfinite(err_rotvec)):
-            err_rotvec = np.zeros(3, dtype=np.float32)
+        # Body-frame error rotation current^-1 * desired, the conjugate is the inverse of a unit quaternion
+        cx, cy, cz, cw = cast(list[float], self.ahrs.quaternion.tolist())
+        q_err = _quat_mul(
+            (-cx, -cy, -cz, cw), cast(_Quat, tuple(self.desired_quaternion.tolist()))
+        )
+        err_rotvec = self._stabilization_error_buffer
+        error = _quat_to_rotvec(q_err)
+        if all(math.isfinite(component) for component in error):
+            err_rotvec[:] = error
+        else:
+            err_rotvec[:] = 0.0
 
-        if np.linalg.norm(direction_vector_attitude[0:3]) < INTEGRAL_RELAX_THRESHOLD:
+        dx, dy, dz = cast(list[float], direction_vector_attitude[0:3].tolist())
+        if dx * dx + dy * dy + dz * dz < _INTEGRAL_RELAX_THRESHOLD_SQ:
             self.integral_attitude_rad += err_rotvec * dt
 
-        clip_rad = cast(
-            np.float32, np.deg2rad(INTEGRAL_WINDUP_CLIP_DEGREES, dtype=np.float32)
-        )
-        self.integral_attitude_rad = np.clip(
-            self.integral_attitude_rad, -clip_rad, clip_rad, dtype=np.float32
+        np.clip(
+            self.integral_attitude_rad,
+            -_INTEGRAL_WINDUP_CLIP_RAD,
+            _INTEGRAL_WINDUP_CLIP_RAD,
+            out=self.integral_attitude_rad,
         )
 
-        omega = self.gyro_rad_s.astype(np.float32, copy=False)
-
-        # PID per axis (roll=x, pitch=y, yaw=z)
-        u_roll = cast(
-            float,
-            config.roll.kp * err_rotvec[0]
-            + config.roll.ki * self.integral_attitude_rad[0]
-            + config.roll.kd * (-omega[0]),
-        )
-        u_pitch = cast(
-            float,
-            config.pitch.kp * err_rotvec[1]
-            + config.pitch.ki * self.integral_attitude_rad[1]
-            + config.pitch.kd * (-omega[1]),
-        )
-        u_yaw = cast(
-            float,
-            config.yaw.kp * err_rotvec[2]
-            + config.yaw.ki * self.integral_attitude_rad[2]
-            + config.yaw.kd * (-omega[2]),
-        )
+        self._refresh_stabilization_gains()
+
+        # PID on all three body axes at once (roll=x, pitch=y, yaw=z), the gains already carry the output scale
+        u = self._stabilization_pid_buffer
+        np.multiply(self._stabilization_kp, err_rotvec, out=u)
+        u += self._stabilization_ki * self.integral_attitude_rad
+        u -= self._stabilization_kd * self.gyro_rad_s
+
+        # Back-calculation anti-windup: while the output is past what the regulator power limit lets through,
+        # move the integral by (u_sat - u) / (ki * Tt) so it stops growing against the limit. Tt = max(kp / ki, dt),
+        # so one tick never moves the output past the limit, which would flip its sign when kp / ki < dt / 2.
+        limit = float(self.state.rov_config.power.regulator_limit) / 100.0
+        ux, uy, uz = cast(list[float], u.tolist())
+        if max(abs(ux), abs(uy), abs(uz)) > limit:
+            self.integral_attitude_rad += [
+                min(dt * inv_kp, inv_ki)
+                * ((limit if v > limit else -limit if v < -limit else v) - v)
+                for v, (inv_kp, inv_ki) in zip(
+                    (ux, uy, uz), self._stabilization_tracking, strict=True
+                )
+            ]
 
         stabilization_actuation = self._stabilization_actuation_buffer
-        stabilization_actuation[0] = np.float32(
-            u_pitch / 10.0
-        )  # Divide by 10 to avoid unsatisfying PID constant values
-        stabilization_actuation[1] = np.float32(u_yaw / 10.0)
-        stabilization_actuation[2] = np.float32(u_roll / 10.0)
+        np.take(u, _BODY_TO_PITCH_YAW_ROLL, out=stabilization_actuation)
 
         return stabilization_actuation
 
-    def _transform_movement_vector_world_to_body(
-        self, direction_vector_movement: NDArray[np.float32]
-    ) -> NDArray[np.float32]:
-        """Convert a world-frame surge/sway/heave movement vector into the vehicle body frame and apply per-axis direction coefficients.
+    def _update_body_transform(self) -> NDArray[np.float32]:
+        """Fill the world-to-body matrix for the current attitude with yaw removed.
 
-        Parameters:
-            direction_vector_movement (NDArray[np.float32]): 3-element world-frame movement vector [surge, sway, heave].
+        The yaw-stripped attitude is Ry(pitch) * Rx(roll), so its inverse is written directly as the
+        transpose of that closed-form product instead of going through Rotation objects. The matrix is
+        only rebuilt when the AHRS attitude has changed since the last call.
 
         Returns:
-            NDArray[np.float32]: 3-element movement vector expressed in the body frame with direction coefficients applied.
+            NDArray[np.float32]: 3x3 matrix mapping a (yaw-free) world-frame vector into the body frame.
         """
-        current_attitude = self.ahrs.current_attitude
-
-        # Remove yaw component from current attitude, because surge should always make ROV move forward relative to body, regardless of yaw
-        _yaw, pitch, roll = current_attitude.as_euler("ZYX", degrees=False)
-        current_attitude = Rotation.from_euler("ZYX", [0, pitch, roll], degrees=False)
+        body_transform = self._body_transform
+        if self._body_transform_version == self.ahrs.version:
+            return body_transform
 
-        basis_vectors = cast(
-            NDArray[np.float32], current_attitude.inv().apply(self._unit_vectors)
+        _yaw, pitch, roll = _quat_to_euler_zyx(
+            cast(_Quat, tuple(self.ahrs.quaternion.tolist()))
         )
+        cp, sp = math.cos(pitch), math.sin(pitch)
+        cr, sr = math.cos(roll), math.sin(roll)
 
+        body_transform[0] = (cp, 0.0, -sp)
+        body_transform[1] = (sp * sr, cr, cp * sr)
+        body_transform[2] = (sp * cr, -sr, cp * cr)
+        self._body_transform_version = self.ahrs.version
+        return body_transform
+
+    def _refresh_movement_ratios(self) -> bool:
+        """Rebuild the cross-axis ratio matrix when the direction coefficients config object changes.
+
+        Heave leaking into the horizontal body axes is rescaled by heave/surge and heave/sway, and surge/sway leaking
+        into the vertical body axis by surge/heave and sway/heave. Non-finite coefficients count as 1.0 and a zero
+        denominator gives a zero ratio.
+
+        Returns:
+            bool: True if the ratios were rebuilt.
+        """
         dir_coeffs = self.state.rov_config.direction_coefficients
-        surge_coeff = dir_coeffs.surge if np.isfinite(dir_coeffs.surge) else 1.0
-        sway_coeff = dir_coeffs.sway if np.isfinite(dir_coeffs.sway) else 1.0
-        heave_coeff = dir_coeffs.heave if np.isfinite(dir_coeffs.heave) else 1.0
+        if dir_coeffs is self._movement_ratios_config:
+            return False
+
+        surge_coeff = dir_coeffs.surge if math.isfinite(dir_coeffs.surge) else 1.0
+        sway_coeff = dir_coeffs.sway if math.isfinite(dir_coeffs.sway) else 1.0
+        heave_coeff = dir_coeffs.heave if math.isfinite(dir_coeffs.heave) else 1.0
 
         surge_heave_ratio = surge_coeff / heave_coeff if heave_coeff != 0 else 0.0
         sway_heave_ratio = sway_coeff / heave_coeff if heave_coeff != 0 else 0.0
         heave_surge_ratio = heave_coeff / surge_coeff if surge_coeff != 0 else 0.0
         heave_sway_ratio = heave_coeff / sway_coeff if sway_coeff != 0 else 0.0
 
-        surge = float(direction_vector_movement[0])
-        sway = float(direction_vector_movement[1])
-        heave = float(direction_vector_movement[2])
+        ratios = self._movement_ratios
+        ratios[0] = (1.0, 1.0, heave_surge_ratio)
+        ratios[1] = (1.0, 1.0, heave_sway_ratio)
+        ratios[2] = (surge_heave_ratio, sway_heave_ratio, 1.0)
+        self._movement_ratios_config = dir_coeffs
+        return True
+
+    def _update_movement_transform(self) -> NDArray[np.float32]:
+        """Return the yaw-stripped world-to-body matrix with the direction coefficient ratios folded in.
+
+        Rebuilt only when the attitude or the direction coefficients change, so every movement vector transformed in a tick shares one matrix.
+
+        Returns:
+            NDArray[np.float32]: 3x3 movement transform, in a buffer reused across calls.
+        """
+        # Remove yaw component from current attitude, because surge should always make ROV move forward relative to body, regardless of yaw
+        body_transform = self._update_body_transform()
+        movement_transform = self._movement_transform
+        if (
+            self._refresh_movement_ratios()
+            or self._movement_transform_version != self._body_transform_version
+        ):
+            np.multiply(body_transform, self._movement_ratios, out=movement_transform)
+            self._movement_transform_version = self._body_transform_version
+        return movement_transform
+
+    def _transform_movement_vector_world_to_body(
+        self, direction_vector_movement: NDArray[np.float32]
+    ) -> NDArray[np.float32]:
+        """Convert a world-frame surge/sway/heave movement vector into the vehicle body frame and apply per-axis direction coefficients.
+
+        Parameters:
+            direction_vector_movement (NDArray[np.float32]): 3-element world-frame movement vector [surge, sway, heave]. Only read, so a view into the direction vector may be passed.
 
+        Returns:
+            NDArray[np.float32]: 3-element movement vector expressed in the body frame with direction coefficients applied, in a buffer reused across calls.
+        """
         world_frame_movement = self._world_frame_movement_buffer
-        world_frame_movement[0] = (
-            basis_vectors[0][0] * surge
-            + basis_vectors[1][0] * sway
-            + basis_vectors[2][0] * heave * heave_surge_ratio
-        )
-        world_frame_movement[1] = (
-            basis_vectors[0][1] * surge
-            + basis_vectors[1][1] * sway
-            + basis_vectors[2][1] * heave * heave_sway_ratio
-        )
-        world_frame_movement[2] = (
-            basis_vectors[0][2] * surge * surge_heave_ratio
-            + basis_vectors[1][2] * sway * sway_heave_ratio
-            + basis_vectors[2][2] * heave
+        np.dot(
+            self._update_movement_transform(),
+            direction_vector_movement,
+            out=world_frame_movement,
         )
 
         return world_frame_movement
@@ -601,36 +929,58 @@ class Regulator:
 
         Scales thruster components (indices 0-5) by state.rov_config.power.thrusters_limit / 100.0
         and action components (indices 6-7) by state.rov_config.power.actions_limit / 100.0.
+        Both factors live in one cached 8-element scale vector so this is a single multiply.
 
         Parameters:
             direction_vector (numpy.ndarray): Mutable 1-D float32 array (expected length 8) representing the direction vector to be scaled in place.
         """
-        thruster_scale = np.float32(
-            float(self.state.rov_config.power.thrusters_limit) / 100.0
-        )
-        direction_vector[0:6] *= thruster_scale
+        self._refresh_user_power_scale()
+        direction_vector *= self._user_power_scale
 
-        action_scale = np.float32(
-            float(self.state.rov_config.power.actions_limit) / 100.0
-        )
-        direction_vector[6:8] *= action_scale
+    def _refresh_user_power_scale(self) -> None:
+        """Rebuild the per-element user power scale when the power config object changes."""
+        power = self.state.rov_config.power
+        if power is self._user_power_scale_config:
+            return
+        thruster_scale = float(power.thrusters_limit) / 100.0
+        action_scale = float(power.actions_limit) / 100.0
+        self._user_power_scale[0:6] = thruster_scale
+        self._user_power_scale[6:8] = action_scale
+        self._user_power_scale_config = power
 
-    def _scale_regulator_direction_vector(
-        self, regulator_direction_vector: NDArray[np.float32]
-    ) -> None:
-        """Clip the regulator direction vector in-place to the configured per-axis maximum regulator power.
+    def _combine_user_and_regulator_direction_vectors(
+        self,
+        direction_vector: NDArray[np.float32],
+        regulator_direction_vector: NDArray[np.float32],
+    ) -> NDArray[np.float32]:
+        """Write the pre-limit sum and the power-limited sum of the user and regulator direction vectors in one pass.
+
+        The user part is scaled like _scale_direction_vector_with_user_max_power and the regulator part is clipped to
+        the regulator limit before the add. At 8 elements numpy dispatch dominates, so a single pass over Python floats
+        replaces the copy, two adds, clip and multiply.
 
         Parameters:
-            regulator_direction_vector (NDArray[np.float32]): Array of regulator outputs (modified in-place). Each element is clamped to the range [-p, p], where p = state.rov_config.power.regulator_limit / 100.0.
+            direction_vector (NDArray[np.float32]): User direction vector, replaced in place by the limited sum.
+            regulator_direction_vector (NDArray[np.float32]): Regulator contribution, left unchanged.
+
+        Returns:
+            NDArray[np.float32]: The pre-limit sum in the reused unlimited direction vector buffer.
         """
+        self._refresh_user_power_scale()
         power = float(self.state.rov_config.power.regulator_limit) / 100.0
-        _ = np.clip(
-            regulator_direction_vector,
-            -power,
-            power,
-            out=regulator_direction_vector,
-            dtype=np.float32,
-        )
+        user_scale = cast(list[float], self._user_power_scale.tolist())
+        user = cast(list[float], direction_vector.tolist())
+        regulator = cast(list[float], regulator_direction_vector.tolist())
+
+        unlimited_direction_vector = self._unlimited_direction_vector
+        unlimited_direction_vector[:] = [
+            u + r for u, r in zip(user, regulator, strict=True)
+        ]
+        direction_vector[:] = [
+            u * scale + (power if r > power else -power if r < -power else r)
+            for u, scale, r in zip(user, user_scale, regulator, strict=True)
+        ]
+        return unlimited_direction_vector
 
     def apply_regulator_to_direction_vector(
         self, direction_vector: NDArray[np.float32]
@@ -649,85 +999,88 @@ class Regulator:
         Returns:
             NDArray[np.float32]: Combined direction vector before user/regulator power limits are applied.
         """
+        now_ns = time.monotonic_ns()
+        if self.last_run_regulator_ns > 0:
+            self.delta_t_run_regulator = _clamp_dt(
+                (now_ns - self.last_run_regulator_ns) * 1e-9
+            )
+        else:
+            self.delta_t_run_regulator = _DT_NOMINAL
+        self.last_run_regulator_ns = now_ns
+
+        depth_hold_enabled = self.state.system_status.depth_hold
+        stabilization_enabled = self.state.system_status.auto_stabilization
+        if not (depth_hold_enabled or stabilization_enabled):
+            # Nothing to regulate, only the enable flags need tracking and the user power limit applied
+            self._handle_edges()
+            unlimited_direction_vector = self._unlimited_direction_vector
+            unlimited_direction_vector[:] = direction_vector
+            self._scale_direction_vector_with_user_max_power(direction_vector)
+            return unlimited_direction_vector
+
         regulator_direction_vector = self._regulator_direction_vector
         regulator_direction_vector.fill(0.0)
 
-        now = time.time()
-        if self.last_run_regulator_time > 0.0:
-            self.delta_t_run_regulator = _clamp_dt(now - self.last_run_regulator_time)
-        else:
-            self.delta_t_run_regulator = 1 / THRUSTER_SEND_FREQUENCY
-        self.last_run_regulator_time = now
-
         self._update_desired_from_direction_vector(direction_vector)
         self._handle_edges()
 
-        if self.state.system_status.depth_hold:
+        if depth_hold_enabled:
             depth_regulator_actuation = self._handle_depth_hold(
                 cast(np.float32, direction_vector[2])
             )
-            depth_hold_vector = self._depth_hold_vector_buffer
-            depth_hold_vector[:] = (0.0, 0.0, depth_regulator_actuation)
-            regulator_direction_vector[0:3] = (
-                self._transform_movement_vector_world_to_body(depth_hold_vector)
+            # The depth hold vector is pure heave, so its body-frame image is the scaled heave column
+            np.multiply(
+                self._update_movement_transform()[:, 2],
+                depth_regulator_actuation,
+                out=regulator_direction_vector[0:3],
             )
             direction_vector[2] = 0.0
-            movement_vector = self._movement_vector_buffer
-            movement_vector[:] = direction_vector[0:3]
             direction_vector[0:3] = self._transform_movement_vector_world_to_body(
-                movement_vector
+                direction_vector[0:3]
             )
 
-        if self.state.system_status.auto_stabilization:
-            stabilization_input = self._stabilization_input_buffer
-            stabilization_input[:] = direction_vector[3:6]
+        if stabilization_enabled:
             regulator_direction_vector[3:6] = self._handle_stabilization(
-                stabilization_input
+                direction_vector[3:6]
             )
             direction_vector[3:6] = 0.0
 
-        unlimited_direction_vector = self._unlimited_direction_vector
-        unlimited_direction_vector[:] = direction_vector
-        unlimited_direction_vector += regulator_direction_vector
-
-        self._scale_regulator_direction_vector(regulator_direction_vector)
-        self._scale_direction_vector_with_user_max_power(direction_vector)
-
-        direction_vector += regulator_direction_vector
-
-        return unlimited_direction_vector
+        return self._combine_user_and_regulator_direction_vectors(
+            direction_vector, regulator_direction_vector
+        )
 
     def handle_auto_tuning(self, current_time: float) -> NDArray[np.float32] | None:
         """Progresses the regulator auto-tuning state machine and produces the actuation vector to apply for the current tuning step.
 
         This updates internal auto-tuning state (phase, step, collected data, timers) and, when tuning completes, sets `state.regulator.auto_tuning_active` to False and publishes tuned PID suggestions via the message queue. If called with intervals smaller than 1/60 s, returns a zeroed 8-element actuation vector without advancing the state.
 
+        Parameters:
+            current_time (float): Monotonic time in seconds; only differences between calls are used, so wall-clock adjustments cannot stretch or stall a phase.
+
         Returns:
             An 8-element numpy float32 array containing the actuation to apply for the current tuning step, or `None` when auto-tuning has finished and results have been published.
         """
         if not self.auto_tuning_phase:
             self.auto_tuning_phase = "pitch"
             self.auto_tuning_step = "find_zero"
-            self.auto_tuning_data = []
+            self.auto_tuning_sample_count = 0
             self.auto_tuning_params = {}
             self.auto_tuning_last_update = current_time
             self.auto_tuning_zero_actuation = 0.0
             self.auto_tuning_amplitude = 0.0
             self.auto_tuning_oscillation_start = 0.0
+            self._auto_tuning_toast_key = None
             log_info("Starting regulator auto tuning")
 
         dt = current_time - self.auto_tuning_last_update
-        if dt < 1 / 60:
-            return np.zeros(8, dtype=np.float32)
+        if dt < _AUTO_TUNING_MIN_INTERVAL:
+            return self._auto_tuning_vector()
 
         self.auto_tuning_last_update = current_time
 
-        if self.auto_tuning_phase == "pitch":
-            return self._handle_pitch_tuning(current_time)
-        elif self.auto_tuning_phase == "roll":
-            return self._handle_roll_tuning(current_time)
-        elif self.auto_tuning_phase == "depth":
-            return self._handle_depth_tuning(current_time)
+        spec = _AUTO_TUNING_SPECS.get(self.auto_tuning_phase)
+        if spec is not None:
+            return self._handle_axis_tuning(spec, current_time)
         else:
             self.state.regulator.auto_tuning_active = False
             toast_content(
@@ -760,301 +1113,226 @@ class Regulator:
             queue.put_nowait(suggestions)
             return None
 
-    def _handle_pitch_tuning(self, current_time: float) -> NDArray[np.float32]:
-        pitch = self.state.regulator.pitch
+    def _auto_tuning_vector(self, *entries: tuple[int, float]) -> NDArray[np.float32]:
+        """Fill the reused auto-tuning output vector with zeros except for the given (index, actuation) entries.
 
-        if self.auto_tuning_step == "find_zero":
-            toast_content(
-                identifier=AUTO_TUNING_TOAST_ID,
-                variant=ToastVariant.LOADING,
-                content=ToastContent(
-                    message_key="toasts_auto_tuning_tuning_phase",
-                    message_args={"phase": "pitch"},
-                    description_key="toasts_auto_tuning_finding_zero",
-                ),
-                action=None,
-            )
-            if abs(pitch) < AUTO_TUNING_ZERO_THRESHOLD_DEGREES:
-                self.auto_tuning_step = "find_amplitude"
-                log_info(
-                    f"Pitch zero found at actuation {self.auto_tuning_zero_actuation}"
-                )
-            else:
-                self.auto_tuning_zero_actuation += 0.001 if pitch > 0 else -0.001
-                return np.array(
-                    [0, 0, 0, self.auto_tuning_zero_actuation, 0, 0, 0, 0],
-                    dtype=np.float32,
-                )
-
-        elif self.auto_tuning_step == "find_amplitude":
-            toast_content(
-                identifier=AUTO_TUNING_TOAST_ID,
-                variant=ToastVariant.LOADING,
-                content=ToastContent(
-                    message_key="toasts_auto_tuning_tuning_phase",
-                    message_args={"phase": "pitch"},
-                    description_key="toasts_auto_tuning_finding_oscillation",
-                ),
-                action=None,
-            )
-            self.auto_tuning_amplitude += 0.002
-            actuation = (
-                self.auto_tuning_zero_actuation + self.auto_tuning_amplitude
-                if pitch > 0
-                else self.auto_tuning_zero_actuation - self.auto_tuning_amplitude
-            )
-            if abs(pitch) > AUTO_TUNING_AMPLITUDE_THRESHOLD_DEGREES:
-                self.auto_tuning_step = "oscillate"
-                self.auto_tuning_oscillation_start = current_time
-                log_info(f"Pitch amplitude found: {self.auto_tuning_amplitude}")
-            return np.array([0, 0, 0, actuation, 0, 0, 0, 0], dtype=np.float32)
-
-        elif self.auto_tuning_step == "oscillate":
-            elapsed = current_time - self.auto_tuning_oscillation_start
-            if elapsed >= AUTO_TUNING_OSCILLATION_DURATION_SECONDS:
-                self.auto_tuning_step = "fit_curve"
-                self._fit_curve("pitch")
-                return np.zeros(8, dtype=np.float32)
-            actuation = (
-                self.auto_tuning_zero_actuation + self.auto_tuning_amplitude
-                if pitch > 0
-                else self.auto_tuning_zero_actuation - self.auto_tuning_amplitude
-            )
-            self.auto_tuning_data.append((current_time, pitch))
-            toast_content(
-                identifier=AUTO_TUNING_TOAST_ID,
-                variant=ToastVariant.LOADING,
-                content=ToastContent(
-                    message_key="toasts_auto_tuning_tuning_phase",
-                    message_args={"phase": "pitch"},
-                    description_key="toasts_auto_tuning_oscillating",
-                    description_args={"seconds": int(elapsed)},
-                ),
-                action=None,
-            )
-            return np.array([0, 0, 0, actuation, 0, 0, 0, 0], dtype=np.float32)
+        Returns:
+            NDArray[np.float32]: The shared 8-element direction vector, only valid until the next auto-tuning tick.
+        """
+        output = self._auto_tuning_output
+        output.fill(0.0)
+        for index, actuation in entries:
+            output[index] = actuation
+        return output
+
+    def _handle_axis_tuning(
+        self, spec: _AxisTuningSpec, current_time: float
+    ) -> NDArray[np.float32]:
+        """Advance the find_zero -> find_amplitude -> oscillate -> fit_curve steps for one auto-tuning phase.
 
-        elif self.auto_tuning_step == "fit_curve":
-            self.auto_tuning_phase = "roll"
-            self.auto_tuning_step = "find_zero"
-            self.auto_tuning_data = []
-            self.auto_tuning_zero_actuation = 0.0
-            self.auto_tuning_amplitude = 0.0
-            log_info("Pitch tuning complete, starting roll")
-        return np.zeros(8, dtype=np.float32)
+        Parameters:
+            spec (_AxisTuningSpec): Phase description (measured axis, thresholds, driven direction vector element and next phase).
+            current_time (float): Current time in seconds.
 
-    def _handle_roll_tuning(self, current_time: float) -> NDArray[np.float32]:
-        roll = self.state.regulator.roll
-        pitch = self.state.regulator.pitch
+        Returns:
+            NDArray[np.float32]: The reused 8-element direction vector to apply for this tick.
+        """
+        error, sample = spec.measure(self.state)
+        label = spec.label
 
         if self.auto_tuning_step == "find_zero":
-            toast_content(
-                identifier=AUTO_TUNING_TOAST_ID,
-                variant=ToastVariant.LOADING,
-                content=ToastContent(
-                    message_key="toasts_auto_tuning_tuning_phase",
-                    message_args={"phase": "roll"},
-                    description_key="toasts_auto_tuning_finding_zero",
-                ),
-                action=None,
+            self._toast_auto_tuning_progress(
+                current_time, spec.axis, "toasts_auto_tuning_finding_zero"
             )
-            if abs(roll) < AUTO_TUNING_ZERO_THRESHOLD_DEGREES:
+            if abs(error) < spec.zero_threshold:
                 self.auto_tuning_step = "find_amplitude"
                 log_info(
-                    f"Roll zero found at actuation {self.auto_tuning_zero_actuation}"
+                    f"{label} zero found at actuation {self.auto_tuning_zero_actuation}"
                 )
             else:
-                self.auto_tuning_zero_actuation += 0.001 if roll > 0 else -0.001
-                pitch_comp = -pitch * self.state.rov_config.regulator.pitch.kp * 0.5
-                return np.array(
-                    [0, 0, 0, pitch_comp, 0, self.auto_tuning_zero_actuation, 0, 0],
-                    dtype=np.float32,
-                )
+                self.auto_tuning_zero_actuation += math.copysign(0.001, error)
+                return self._axis_tuning_vector(spec, self.auto_tuning_zero_actuation)
 
         elif self.auto_tuning_step == "find_amplitude":
-            toast_content(
-                identifier=AUTO_TUNING_TOAST_ID,
-                variant=ToastVariant.LOADING,
-                content=ToastContent(
-                    message_key="toasts_auto_tuning_tuning_phase",
-                    message_args={"phase": "roll"},
-                    description_key="toasts_auto_tuning_finding_oscillation",
-                ),
-                action=None,
+            self._toast_auto_tuning_progress(
+                current_time, spec.axis, "toasts_auto_tuning_finding_oscillation"
             )
             self.auto_tuning_amplitude += 0.002
             actuation = (
                 self.auto_tuning_zero_actuation + self.auto_tuning_amplitude
-                if roll > 0
+                if error > 0
                 else self.auto_tuning_zero_actuation - self.auto_tuning_amplitude
             )
-            pitch_comp = -pitch * self.state.rov_config.regulator.pitch.kp * 0.5
-            if abs(roll) > AUTO_TUNING_AMPLITUDE_THRESHOLD_DEGREES:
+            if abs(error) > spec.amplitude_threshold:
                 self.auto_tuning_step = "oscillate"
                 self.auto_tuning_oscillation_start = current_time
-                log_info(f"Roll amplitude found: {self.auto_tuning_amplitude}")
-            return np.array([0, 0, 0, pitch_comp, 0, actuation, 0, 0], dtype=np.float32)
+                log_info(f"{label} amplitude found: {self.auto_tuning_amplitude}")
+            return self._axis_tuning_vector(spec, actuation)
 
         elif self.auto_tuning_step == "oscillate":
             elapsed = current_time - self.auto_tuning_oscillation_start
             if elapsed >= AUTO_TUNING_OSCILLATION_DURATION_SECONDS:
                 self.auto_tuning_step = "fit_curve"
-                self._fit_curve("roll")
-                return np.zeros(8, dtype=np.float32)
+                self._fit_curve(spec.axis)
+                return self._auto_tuning_vector()
             actuation = (
                 self.auto_tuning_zero_actuation + self.auto_tuning_amplitude
-                if roll > 0
+                if error > 0
                 else self.auto_tuning_zero_actuation - self.auto_tuning_amplitude
             )
-            pitch_comp = -pitch * self.state.rov_config.regulator.pitch.kp * 0.5
-            self.auto_tuning_data.append((current_time, roll))
-            toast_content(
-                identifier=AUTO_TUNING_TOAST_ID,
-                variant=ToastVariant.LOADING,
-                content=ToastContent(
-                    message_key="toasts_auto_tuning_tuning_phase",
-                    message_args={"phase": "roll"},
-                    description_key="toasts_auto_tuning_oscillating",
-                    description_args={"seconds": int(elapsed)},
-                ),
-                action=None,
+            # Depth only updates at the pressure sensor rate, so skip held repeats of the previous sample
+            count = self.auto_tuning_sample_count
+            if count < _AUTO_TUNING_MAX_SAMPLES and (
+                count == 0 or sample != self.auto_tuning_last_sample
+            ):
+                self.auto_tuning_times[count] = elapsed
+                self.auto_tuning_values[count] = sample
+                self.auto_tuning_sample_count = count + 1
+                self.auto_tuning_last_sample = sample
+            self._toast_auto_tuning_progress(
+                current_time,
+                spec.axis,
+                "toasts_auto_tuning_oscillating",
+                seconds=int(elapsed),
             )
-            return np.array([0, 0, 0, pitch_comp, 0, actuation, 0, 0], dtype=np.float32)
+            return self._axis_tuning_vector(spec, actuation)
 
         elif self.auto_tuning_step == "fit_curve":
-            self.auto_tuning_phase = "depth"
+            self.auto_tuning_phase = spec.next_phase
             self.auto_tuning_step = "find_zero"
-            self.auto_tuning_data = []
+            self.auto_tuning_sample_count = 0
             self.auto_tuning_zero_actuation = 0.0
             self.auto_tuning_amplitude = 0.0
-            log_info("Roll tuning complete, starting depth")
-            return np.zeros(8, dtype=np.float32)
-
-        return np.zeros(8, dtype=np.float32)
-
-    def _handle_depth_tuning(self, current_time: float) -> NDArray[np.float32]:
-        depth = self.state.pressure.depth
-
-        if self.auto_tuning_step == "find_zero":
-            toast_content(
-                identifier=AUTO_TUNING_TOAST_ID,
-                variant=ToastVariant.LOADING,
-                content=ToastContent(
-                    message_key="toasts_auto_tuning_tuning_phase",
-                    message_args={"phase": "depth"},
-                    description_key="toasts_auto_tuning_finding_zero",
-                ),
-                action=None,
-            )
-            if (
-                abs(depth - self.state.regulator.desired_depth)
-                < AUTO_TUNING_ZERO_THRESHOLD_DEPTH_METERS
-            ):
-                self.auto_tuning_step = "find_amplitude"
-                log_info(
-                    f"Depth zero found at actuation {self.auto_tuning_zero_actuation}"
-                )
+            if spec.next_phase == "done":
+                log_info(f"{label} tuning complete")
             else:
-                self.auto_tuning_zero_actuation += (
-                    0.001 if depth > self.state.regulator.desired_depth else -0.001
-                )
-                return np.array(
-                    [0, 0, self.auto_tuning_zero_actuation, 0, 0, 0, 0, 0],
-                    dtype=np.float32,
-                )
+                log_info(f"{label} tuning complete, starting {spec.next_phase}")
 
-        elif self.auto_tuning_step == "find_amplitude":
-            toast_content(
-                identifier=AUTO_TUNING_TOAST_ID,
-                variant=ToastVariant.LOADING,
-                content=ToastContent(
-                    message_key="toasts_auto_tuning_tuning_phase",
-                    message_args={"phase": "depth"},
-                    description_key="toasts_auto_tuning_finding_oscillation",
-                ),
-                action=None,
-            )
-            self.auto_tuning_amplitude += 0.002
-            actuation = (
-                self.auto_tuning_zero_actuation + self.auto_tuning_amplitude
-                if depth > self.state.regulator.desired_depth
-                else self.auto_tuning_zero_actuation - self.auto_tuning_amplitude
-            )
-            if (
-                abs(depth - self.state.regulator.desired_depth)
-                > AUTO_TUNING_AMPLITUDE_THRESHOLD_DEPTH_METERS
-            ):
-                self.auto_tuning_step = "oscillate"
-                self.auto_tuning_oscillation_start = current_time
-                log_info(f"Depth amplitude found: {self.auto_tuning_amplitude}")
-            return np.array([0, 0, actuation, 0, 0, 0, 0, 0], dtype=np.float32)
+        return self._auto_tuning_vector()
 
-        elif self.auto_tuning_step == "oscillate":
-            elapsed = current_time - self.auto_tuning_oscillation_start
-            if elapsed >= AUTO_TUNING_OSCILLATION_DURATION_SECONDS:
-                self.auto_tuning_step = "fit_curve"
-                self._fit_curve("depth")
-                return np.zeros(8, dtype=np.float32)
-            actuation = (
-                self.auto_tuning_zero_actuation + self.auto_tuning_amplitude
-                if depth > self.state.regulator.desired_depth
-                else self.auto_tuning_zero_actuation - self.auto_tuning_amplitude
-            )
-            self.auto_tuning_data.append((current_time, depth))
-            toast_content(
-                identifier=AUTO_TUNING_TOAST_ID,
-                variant=ToastVariant.LOADING,
-                content=ToastContent(
-                    message_key="toasts_auto_tuning_tuning_phase",
-                    message_args={"phase": "depth"},
-                    description_key="toasts_auto_tuning_oscillating",
-                    description_args={"seconds": int(elapsed)},
-                ),
-                action=None,
+    def _axis_tuning_vector(
+        self, spec: _AxisTuningSpec, actuation: float
+    ) -> NDArray[np.float32]:
+        """Build the auto-tuning output for a phase, driving its axis and, for roll, holding pitch with a P term."""
+        if spec.pitch_compensation:
+            self._refresh_stabilization_gains()
+            pitch_comp = -self.state.regulator.pitch * self._pitch_hold_gain
+            return self._auto_tuning_vector(
+                (3, pitch_comp), (spec.output_index, actuation)
             )
-            return np.array([0, 0, actuation, 0, 0, 0, 0, 0], dtype=np.float32)
+        return self._auto_tuning_vector((spec.output_index, actuation))
 
-        elif self.auto_tuning_step == "fit_curve":
-            self.auto_tuning_phase = "done"
-            log_info("Depth tuning complete")
-            return np.zeros(8, dtype=np.float32)
+    def _toast_auto_tuning_progress(
+        self,
+        current_time: float,
+        axis: str,
+        description_key: str,
+        seconds: int | None = None,
+    ) -> None:
+        """Show the auto-tuning progress toast, skipping it if the same text was sent within the refresh interval.
 
-        return np.zeros(8, dtype=np.float32)
+        The handlers run at the thruster send rate while the text only changes on step changes and once per second
+        while oscillating, so resending unchanged toasts would only flood the websocket queue.
+        """
+        toast_key = (axis, description_key, seconds)
+        if (
+            toast_key == self._auto_tuning_toast_key
+            and current_time - self._auto_tuning_toast_time
+            < _AUTO_TUNING_TOAST_REFRESH_SECONDS
+        ):
+            return
+        self._auto_tuning_toast_key = toast_key
+        self._auto_tuning_toast_time = current_time
+
+        toast_content(
+            identifier=AUTO_TUNING_TOAST_ID,
+            variant=ToastVariant.LOADING,
+            content=ToastContent(
+                message_key="toasts_auto_tuning_tuning_phase",
+                message_args={"phase": axis},
+                description_key=description_key,
+                description_args=None if seconds is None else {"seconds": seconds},
+            ),
+            action=None,
+        )
 
     def _fit_curve(self, axis: str) -> None:
-        if not self.auto_tuning_data:
+        count = self.auto_tuning_sample_count
+        if count == 0:
             log_error(f"No data for {axis} curve fitting")
             return
 
-        times = [t[0] for t in self.auto_tuning_data]
-        values = [t[1] for t in self.auto_tuning_data]
-        times = np.array(times, dtype=np.float32) - np.float32(times[0])
-        values = np.array(values, dtype=np.float32)
+        # Widen the float32 recordings once, the spectrum and the fit both work in float64
+        times = self.auto_tuning_times[:count].astype(np.float64)
+        times -= times[0]
+        values = self.auto_tuning_values[:count].astype(np.float64)
+
+        # The model takes 2 * pi * t so the phase argument is one multiply-add, and the Jacobian is closed form
+        two_pi_times = math.tau * times
 
         def sine_wave(
-            x: NDArray[np.float32], a: float, f: float, phi: float, offset: float
-        ) -> NDArray[np.float32]:
-            return cast(
-                NDArray[np.float32], a * np.sin(2 * np.pi * f * x + phi) + offset
-            )
+            x: NDArray[np.float64], a: float, f: float, phi: float, offset: float
+        ) -> NDArray[np.float64]:
+            return a * np.sin(f * x + phi) + offset
+
+        def sine_wave_jacobian(
+            x: NDArray[np.float64], a: float, f: float, phi: float, _offset: float
+        ) -> NDArray[np.float64]:
+            theta = f * x + phi
+            a_cos = a * np.cos(theta)
+            jacobian = np.empty((x.size, 4))
+            jacobian[:, 0] = np.sin(theta)
+            jacobian[:, 1] = x * a_cos
+            jacobian[:, 2] = a_cos
+            jacobian[:, 3] = 1.0
+            return jacobian
+
+        estimate = _estimate_sinusoid(times, values)
 
         try:
-            params, _ = curve_fit(
-                sine_wave,
-                times,
-                values,
-                p0=[(np.max(values) - np.min(values)) / 2, 1 / 10, 0, np.mean(values)],
-            )
-            a, f, _, _ = params
-            a = cast(np.float32, a)
-            f = cast(np.float32, f)
-            tu = 1 / f
-            ku = (4 * self.auto_tuning_amplitude) / (np.pi * a)
-            kp = float(0.6 * ku)
-            ki = float(1.2 * ku / tu)
-            kd = float(0.075 * ku * tu)
+            if estimate is not None and estimate.prominent:
+                # A clean single-tone spectrum already pins down amplitude and frequency
+                a = estimate.amplitude
+                f = estimate.frequency
+            else:
+                # Otherwise seed the fit from the spectrum so it starts near the oscillation frequency
+                if estimate is not None:
+                    initial_guess = (
+                        estimate.amplitude,
+                        estimate.frequency,
+                        estimate.phase,
+                        estimate.offset,
+                    )
+                else:
+                    initial_guess = (
+                        0.5 * float(np.ptp(values)),
+                        1 / 10,
+                        0.0,
+                        float(values.mean()),
+                    )
+                params, _ = curve_fit(
+                    sine_wave,
+                    two_pi_times,
+                    values,
+                    p0=initial_guess,
+                    method="lm",
+                    jac=sine_wave_jacobian,
+                    maxfev=_SINE_FIT_MAX_EVALUATIONS,
+                    xtol=_SINE_FIT_TOLERANCE,
+                    ftol=_SINE_FIT_TOLERANCE,
+                )
+                # The fit may land on the mirrored solution (-a, phi + pi), only magnitudes matter here
+                a = abs(float(params[0]))
+                f = abs(float(params[1]))
+            # Ziegler-Nichols with the ultimate period tu = 1 / f folded in
+            ku = (4.0 * self.auto_tuning_amplitude) / (math.pi * a)
+            kp = 0.6 * ku
+            ki = 1.2 * ku * f
+            kd = 0.075 * ku / f
             self.auto_tuning_params[axis] = AxisConfig(kp=kp, ki=ki, kd=kd)
             log_info(f"{axis} PID: Kp={kp:.3f}, Ki={ki:.3f}, Kd={kd:.3f}")
-        except Exception as e:
+        # curve_fit raises RuntimeError when it does not converge, TypeError with fewer samples than parameters and
+        # ValueError on non-finite data, and a zero amplitude or frequency leaves nothing to derive gains from
+        except (RuntimeError, TypeError, ValueError, ZeroDivisionError) as e:
             log_error(f"Curve fitting failed for {axis}: {e}")
             self.auto_tuning_params[axis] = AxisConfig(kp=0, ki=0, kd=0)
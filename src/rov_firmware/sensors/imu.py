@@ -15,6 +15,7 @@ from bmi270.BMI270 import (
     PERFORMANCE_MODE,
 )
 import numpy as np
+from numpy.typing import NDArray
 
 from ..constants import IMU_READ_FREQUENCY, SYSTEM_FAILURE_THRESHOLD
 from ..log import log_error, log_info
@@ -23,6 +24,10 @@ from ..rov_state import RovState
 from ..toast import ToastContent, toast_error
 
 
+_RAW_FULL_SCALE = 32768.0
+_ENU_TO_NED_SIGNS = np.array([1.0, -1.0, -1.0], dtype=np.float32)
+
+
 class Imu:
     """IMU sensor class."""
 
@@ -34,6 +39,8 @@ class Imu:
         """
         self.state: RovState = state
         self.imu: BMI270 | None = None
+        self._accel_scale: NDArray[np.float32] = _ENU_TO_NED_SIGNS.copy()
+        self._gyr_scale: NDArray[np.float32] = _ENU_TO_NED_SIGNS.copy()
 
     async def initialize(self) -> None:
         """Initialize the BMI270 IMU sensor with performance settings."""
@@ -55,6 +62,13 @@ class Imu:
             await asyncio.to_thread(imu_instance.enable_gyr_noise_perf)
             await asyncio.to_thread(imu_instance.enable_gyr_filter_perf)
 
+            # Fold the raw-count scaling and the ENU -> NED flip into one float32 vector per sensor
+            self._accel_scale = _ENU_TO_NED_SIGNS * np.float32(
+                imu_instance.acc_range / _RAW_FULL_SCALE
+            )
+            self._gyr_scale = _ENU_TO_NED_SIGNS * np.float32(
+                np.deg2rad(imu_instance.gyr_range) / _RAW_FULL_SCALE
+            )
             self.imu = imu_instance
             self.state.system_health.imu_healthy = True
             log_info("BMI270 IMU initialized successfully.")
@@ -92,10 +106,9 @@ class Imu:
                 bytes(raw), dtype="<i2"
             )  # 6 signed int16, little-endian
 
-            accel = (raw_arr[:3] / 32768.0 * self.imu.acc_range).astype(np.float32)
-            gyr = (np.deg2rad(1.0) * raw_arr[3:] / 32768.0 * self.imu.gyr_range).astype(
-                np.float32
-            )
+            # int16 * float32 yields float32 in NED directly
+            accel = raw_arr[:3] * self._accel_scale
+            gyr = raw_arr[3:] * self._gyr_scale
 
             # Burst read: registers 0x22-0x23 (2 bytes) -> temperature
             temp_raw = self.imu.bus.read_i2c_block_data(self.imu.address, 0x22, 2)
@@ -104,10 +117,6 @@ class Imu:
             )
             temperature = temp_int16 * 0.001952594 + 23.0
 
-            # Change convention from ENU to NED
-            accel *= np.array([1.0, -1.0, -1.0], dtype=np.float32)
-            gyr *= np.array([1.0, -1.0, -1.0], dtype=np.float32)
-
             return ImuData(
                 acceleration=accel,
                 gyroscope=gyr,
@@ -577,10 +577,10 @@ class Thrusters:
         return False
 
     def _determine_thrust_vector(
-        self, current_time: float, last_send_time: float
+        self, current_time: float, monotonic_time: float, last_send_time: float
     ) -> tuple[NDArray[np.float32] | None, float]:
         if self.state.regulator.auto_tuning_active:
-            tuning_vector = self.regulator.handle_auto_tuning(current_time)
+            tuning_vector = self.regulator.handle_auto_tuning(monotonic_time)
             if tuning_vector is not None:
                 direction_vector = tuning_vector
                 thrust_vector = self._create_thrust_vector_from_direction_vector(
@@ -657,8 +657,10 @@ class Thrusters:
                 continue
 
             current_time = time.time()
+            # Tuning only measures intervals, so it runs on the monotonic clock like the regulator
+            monotonic_time = time.monotonic()
             new_thrust_vector, updated_last_send_time = self._determine_thrust_vector(
-                current_time, last_send_time
+                current_time, monotonic_time, last_send_time
             )
             if new_thrust_vector is not None:
                 thrust_vector = new_thrust_vector
@@ -10,14 +10,23 @@ from rov_firmware.constants import (
     MAX_GYRO_DEG_PER_SEC,
     THRUSTER_SEND_FREQUENCY,
 )
-from rov_firmware.models.config import AxisConfig
+from rov_firmware.models.config import AxisConfig, DirectionCoefficients
 from rov_firmware.regulator import (
     Regulator as RegulatorController,
     _clamp_dt,
     _MahonyAhrs,
+    _quat_mul,
+    _quat_to_euler_zyx,
+    _quat_to_rotvec,
+    _rotvec_to_quat,
 )
 
 
+def _set_attitude(ahrs: _MahonyAhrs, attitude: Rotation) -> None:
+    ahrs.quaternion[:] = attitude.as_quat()
+    ahrs.version += 1
+
+
 @pytest.mark.parametrize(
     ("raw_dt", "expected_dt"),
     [
@@ -36,15 +45,34 @@ def test_clamp_dt(raw_dt, expected_dt):
     assert _clamp_dt(raw_dt) == pytest.approx(expected_dt)
 
 
+def test_quaternion_helpers_match_scipy_rotation():
+    a = Rotation.from_euler("ZYX", [30.0, -20.0, 10.0], degrees=True)
+    b = Rotation.from_rotvec([0.1, -0.4, 0.25])
+    qa = tuple(a.as_quat())
+    qb = tuple(b.as_quat())
+
+    assert np.allclose(_quat_mul(qa, qb), (a * b).as_quat())
+    assert np.allclose(_rotvec_to_quat((0.1, -0.4, 0.25)), b.as_quat())
+    assert np.allclose(_rotvec_to_quat((0.0, 0.0, 0.0)), (0.0, 0.0, 0.0, 1.0))
+    small = (0.01, -0.004, 0.0025)
+    assert np.allclose(
+        _rotvec_to_quat(small), Rotation.from_rotvec(small).as_quat(), atol=1e-15
+    )
+    assert np.allclose(_quat_to_euler_zyx(qa), a.as_euler("ZYX"))
+    assert np.allclose(_quat_to_rotvec(qb), b.as_rotvec())
+    assert np.allclose(_quat_to_rotvec(tuple(-b.as_quat())), b.as_rotvec())
+    assert np.allclose(_quat_to_rotvec((0.0, 0.0, 0.0, 1.0)), (0.0, 0.0, 0.0))
+
+
 def test_mahony_reset_zeroes_internal_state():
     ahrs = _MahonyAhrs(kp=1.0, ki=0.5)
     ahrs._integral[:] = np.array([1.0, -2.0, 3.0], dtype=np.float32)
-    ahrs.current_attitude = Rotation.from_euler("ZYX", [10.0, -5.0, 2.0], degrees=True)
+    _set_attitude(ahrs, Rotation.from_euler("ZYX", [10.0, -5.0, 2.0], degrees=True))
 
     ahrs.reset()
 
     assert np.allclose(ahrs._integral, np.zeros(3, dtype=np.float32))
-    assert np.allclose(ahrs.current_attitude.as_quat(), Rotation.identity().as_quat())
+    assert np.allclose(ahrs.quaternion, Rotation.identity().as_quat())
 
 
 def test_mahony_update_with_valid_accel_and_gyro_changes_attitude():
@@ -56,9 +84,7 @@ def test_mahony_update_with_valid_accel_and_gyro_changes_attitude():
         1 / THRUSTER_SEND_FREQUENCY,
     )
 
-    assert not np.allclose(
-        ahrs.current_attitude.as_quat(), Rotation.identity().as_quat()
-    )
+    assert not np.allclose(ahrs.quaternion, Rotation.identity().as_quat())
 
 
 def test_mahony_update_with_zero_accel_norm_falls_back_to_gyro_only():
@@ -68,7 +94,9 @@ def test_mahony_update_with_zero_accel_norm_falls_back_to_gyro_only():
     ahrs.update(gyro.copy(), np.zeros(3, dtype=np.float32), 0.01)
 
     expected = Rotation.from_rotvec(gyro * _clamp_dt(0.01))
-    assert np.allclose(ahrs.current_attitude.as_rotvec(), expected.as_rotvec())
+    assert np.allclose(
+        Rotation.from_quat(ahrs.quaternion).as_rotvec(), expected.as_rotvec()
+    )
 
 
 def test_mahony_update_discards_unreasonably_large_gyro():
@@ -78,10 +106,12 @@ def test_mahony_update_discards_unreasonably_large_gyro():
     )
     ahrs = _MahonyAhrs(kp=1.5, ki=0.05)
 
+    original = gyro.copy()
+
     ahrs.update(gyro, np.array([0.0, 0.0, -9.81], dtype=np.float32), 0.01)
 
-    assert np.allclose(gyro, np.zeros(3, dtype=np.float32))
-    assert np.allclose(ahrs.current_attitude.as_quat(), Rotation.identity().as_quat())
+    assert np.array_equal(gyro, original)
+    assert np.allclose(ahrs.quaternion, Rotation.identity().as_quat())
 
 
 def test_mahony_quaternion_stays_normalized_after_many_updates():
@@ -92,7 +122,7 @@ def test_mahony_quaternion_stays_normalized_after_many_updates():
     for _ in range(50):
         ahrs.update(gyro.copy(), accel, 1 / THRUSTER_SEND_FREQUENCY)
 
-    assert np.linalg.norm(ahrs.current_attitude.as_quat()) == pytest.approx(1.0)
+    assert np.linalg.norm(ahrs.quaternion) == pytest.approx(1.0)
 
 
 def test_imu_update_loop_does_not_depend_on_mcu_connection(rov_state, monkeypatch):
@@ -127,15 +157,52 @@ def test_handle_depth_hold_computes_pid(rov_state):
     actuation = regulator._handle_depth_hold(np.float32(0.25))
 
     error = 3.0
-    expected_integral = 0.5 + error * 0.1 * 0.75
-    expected_actuation = 2.0 * error + 3.0 * expected_integral - 4.0 * 1.2
+    integral = 0.5 + error * 0.1 * 0.75
+    expected_actuation = 2.0 * error + 3.0 * integral - 4.0 * 1.2
+    # The output is past the default 30 % regulator limit, so back-calculation drains the stored integral
+    expected_integral = integral + 0.1 * (0.3 - expected_actuation) / 2.0
 
     assert regulator.integral_depth == pytest.approx(expected_integral)
     assert actuation == pytest.approx(expected_actuation)
 
 
+def test_handle_depth_hold_keeps_integral_when_output_is_within_limit(rov_state):
+    state = rov_state
+    state.rov_config.regulator.depth = AxisConfig(kp=0.1, ki=0.2, kd=0.0, rate=1.0)
+    state.pressure.depth = 1.0
+    state.regulator.desired_depth = 1.5
+    regulator = RegulatorController(state)
+    regulator.delta_t_run_regulator = 0.1
+
+    actuation = regulator._handle_depth_hold(np.float32(0.0))
+
+    assert regulator.integral_depth == pytest.approx(0.05)
+    assert actuation == pytest.approx(0.1 * 0.5 + 0.2 * 0.05)
+
+
+def test_handle_depth_hold_back_calculation_does_not_overshoot_the_limit(rov_state):
+    state = rov_state
+    # kp / ki is below dt / 2, so an unbounded dt / kp tracking gain would flip the output every tick
+    state.rov_config.regulator.depth = AxisConfig(kp=0.005, ki=1.0, kd=0.0, rate=1.0)
+    state.rov_config.power.regulator_limit = 30
+    state.pressure.depth = 0.0
+    state.regulator.desired_depth = 1.0
+    regulator = RegulatorController(state)
+    regulator.delta_t_run_regulator = 0.01
+    regulator.integral_depth = 1.0
+
+    actuations = [regulator._handle_depth_hold(np.float32(0.0)) for _ in range(5)]
+
+    assert actuations[0] == pytest.approx(0.005 + 1.01)
+    # Each later tick adds kp * error + ki * dt * error on top of the limit before being pulled back onto it
+    assert actuations[1:] == pytest.approx([0.31] * 4)
+    assert regulator.integral_depth == pytest.approx(0.295)
+
+
 def test_handle_depth_hold_clips_integral_windup(rov_state):
     state = rov_state
+    # Without a proportional gain there is no back-calculation, so only the clip bounds the integral
+    state.rov_config.regulator.depth = AxisConfig(kp=0.0, ki=1.0, kd=0.0, rate=1.0)
     state.pressure.depth = 0.0
     state.regulator.desired_depth = 100.0
     regulator = RegulatorController(state)
@@ -151,12 +218,13 @@ def test_handle_stabilization_computes_pid_per_axis(rov_state):
     state.rov_config.regulator.pitch = AxisConfig(kp=2.0, ki=3.0, kd=4.0, rate=1.0)
     state.rov_config.regulator.yaw = AxisConfig(kp=5.0, ki=6.0, kd=7.0, rate=1.0)
     state.rov_config.regulator.roll = AxisConfig(kp=8.0, ki=9.0, kd=10.0, rate=1.0)
+    state.rov_config.power.regulator_limit = 100
     regulator = RegulatorController(state)
     regulator.delta_t_run_regulator = 0.2
-    regulator.ahrs.current_attitude = Rotation.identity()
-    regulator.desired_attitude = Rotation.from_rotvec(
+    _set_attitude(regulator.ahrs, Rotation.identity())
+    regulator.desired_quaternion[:] = Rotation.from_rotvec(
         np.array([0.3, -0.2, 0.1], dtype=np.float32)
-    )
+    ).as_quat()
     regulator.gyro_rad_s[:] = np.array([0.5, -0.25, 0.75], dtype=np.float32)
 
     stabilization = regulator._handle_stabilization(np.zeros(3, dtype=np.float32))
@@ -175,14 +243,36 @@ def test_handle_stabilization_computes_pid_per_axis(rov_state):
     assert np.allclose(stabilization, expected)
 
 
+def test_handle_stabilization_back_calculates_saturated_axes(rov_state):
+    state = rov_state
+    state.rov_config.regulator.pitch = AxisConfig(kp=2.0, ki=0.0, kd=0.0, rate=1.0)
+    state.rov_config.regulator.yaw = AxisConfig(kp=2.0, ki=0.0, kd=0.0, rate=1.0)
+    state.rov_config.regulator.roll = AxisConfig(kp=20.0, ki=1.0, kd=0.0, rate=1.0)
+    state.rov_config.power.regulator_limit = 30
+    regulator = RegulatorController(state)
+    regulator.delta_t_run_regulator = 0.1
+    _set_attitude(regulator.ahrs, Rotation.identity())
+    regulator.desired_quaternion[:] = Rotation.from_rotvec(
+        np.array([0.5, 0.1, 0.0], dtype=np.float32)
+    ).as_quat()
+
+    regulator._handle_stabilization(np.zeros(3, dtype=np.float32))
+
+    # Roll asks for (20 * 0.5 + 1 * 0.05) / 10 = 1.005 against the 0.3 limit, pitch stays inside it
+    expected_integral = np.array(
+        [0.05 + 0.1 * (0.3 - 1.005) / 2.0, 0.01, 0.0], dtype=np.float32
+    )
+    assert np.allclose(regulator.integral_attitude_rad, expected_integral, atol=1e-6)
+
+
 def test_handle_stabilization_relaxes_integral_when_user_is_commanding(rov_state):
     state = rov_state
     regulator = RegulatorController(state)
     regulator.delta_t_run_regulator = 0.2
-    regulator.ahrs.current_attitude = Rotation.identity()
-    regulator.desired_attitude = Rotation.from_rotvec(
+    _set_attitude(regulator.ahrs, Rotation.identity())
+    regulator.desired_quaternion[:] = Rotation.from_rotvec(
         np.array([0.2, 0.1, -0.1], dtype=np.float32)
-    )
+    ).as_quat()
     regulator.integral_attitude_rad[:] = np.array([0.1, -0.2, 0.3], dtype=np.float32)
 
     regulator._handle_stabilization(
@@ -200,7 +290,7 @@ def test_transform_movement_vector_world_to_body_is_identity_for_level_attitude(
 ):
     state = rov_state
     regulator = RegulatorController(state)
-    regulator.ahrs.current_attitude = Rotation.identity()
+    _set_attitude(regulator.ahrs, Rotation.identity())
     movement = np.array([1.0, -0.5, 0.25], dtype=np.float32)
 
     transformed = regulator._transform_movement_vector_world_to_body(movement)
@@ -211,8 +301,8 @@ def test_transform_movement_vector_world_to_body_is_identity_for_level_attitude(
 def test_transform_movement_vector_world_to_body_applies_known_rotation(rov_state):
     state = rov_state
     regulator = RegulatorController(state)
-    regulator.ahrs.current_attitude = Rotation.from_euler(
-        "ZYX", [0.0, 0.0, 90.0], degrees=True
+    _set_attitude(
+        regulator.ahrs, Rotation.from_euler("ZYX", [0.0, 0.0, 90.0], degrees=True)
     )
 
     transformed = regulator._transform_movement_vector_world_to_body(
@@ -222,6 +312,51 @@ def test_transform_movement_vector_world_to_body_applies_known_rotation(rov_stat
     assert np.allclose(transformed, np.array([0.0, 0.0, -1.0], dtype=np.float32))
 
 
+def test_body_transform_is_rebuilt_only_after_attitude_changes(rov_state):
+    state = rov_state
+    regulator = RegulatorController(state)
+    _set_attitude(regulator.ahrs, Rotation.identity())
+    movement = np.array([0.0, 1.0, 0.0], dtype=np.float32)
+
+    first = regulator._transform_movement_vector_world_to_body(movement).copy()
+    # A cache hit must return the stored matrix untouched
+    regulator._movement_transform[:] = 0.0
+    assert np.allclose(
+        regulator._transform_movement_vector_world_to_body(movement), 0.0
+    )
+
+    _set_attitude(
+        regulator.ahrs, Rotation.from_euler("ZYX", [0.0, 0.0, 90.0], degrees=True)
+    )
+    transformed = regulator._transform_movement_vector_world_to_body(movement)
+
+    assert np.allclose(first, movement)
+    assert np.allclose(transformed, np.array([0.0, 0.0, -1.0], dtype=np.float32))
+
+
+def test_transform_movement_vector_world_to_body_applies_direction_coefficient_ratios(
+    rov_state,
+):
+    state = rov_state
+    state.rov_config.direction_coefficients = DirectionCoefficients(
+        surge=1.0, sway=1.0, heave=0.5
+    )
+    regulator = RegulatorController(state)
+    _set_attitude(
+        regulator.ahrs, Rotation.from_euler("ZYX", [0.0, 90.0, 0.0], degrees=True)
+    )
+
+    transformed = regulator._transform_movement_vector_world_to_body(
+        np.array([1.0, 0.0, 1.0], dtype=np.float32)
+    )
+
+    # Pitched by 90 degrees: world heave becomes body surge (scaled by heave/surge)
+    # and world surge becomes body heave (scaled by surge/heave)
+    assert np.allclose(
+        transformed, np.array([-0.5, 0.0, 2.0], dtype=np.float32), atol=1e-6
+    )
+
+
 def test_scale_direction_vector_with_user_max_power_scales_thrusters_and_actions_separately(
     rov_state,
 ):
@@ -242,18 +377,325 @@ def test_scale_direction_vector_with_user_max_power_scales_thrusters_and_actions
     )
 
 
-def test_scale_regulator_direction_vector_clips_to_power_limit(rov_state):
+def test_apply_regulator_to_direction_vector_only_scales_user_input_when_regulators_are_off(
+    rov_state,
+):
     state = rov_state
-    state.rov_config.power.regulator_limit = 30
+    state.system_status.depth_hold = False
+    state.system_status.auto_stabilization = False
+    state.rov_config.power.thrusters_limit = 50
+    state.rov_config.power.actions_limit = 100
     regulator = RegulatorController(state)
-    regulator_direction_vector = np.array(
-        [-1.0, -0.2, 0.0, 0.2, 0.6, 1.0, -0.7, 0.7],
+    direction_vector = np.array(
+        [1.0, -1.0, 0.5, -0.5, 0.25, -0.25, 1.0, -1.0],
         dtype=np.float32,
     )
+    original = direction_vector.copy()
 
-    regulator._scale_regulator_direction_vector(regulator_direction_vector)
+    unlimited = regulator.apply_regulator_to_direction_vector(direction_vector)
 
+    assert np.allclose(unlimited, original)
     assert np.allclose(
-        regulator_direction_vector,
-        np.array([-0.3, -0.2, 0.0, 0.2, 0.3, 0.3, -0.3, 0.3], dtype=np.float32),
+        direction_vector,
+        np.array([0.5, -0.5, 0.25, -0.25, 0.125, -0.125, 1.0, -1.0], dtype=np.float32),
+    )
+
+
+def test_update_desired_from_direction_vector_adds_euler_changes_and_clamps_pitch(
+    rov_state,
+):
+    state = rov_state
+    state.system_status.auto_stabilization = True
+    state.rov_config.regulator.fpv_mode = False
+    state.rov_config.regulator.pitch = AxisConfig(kp=0, ki=0, kd=0, rate=60.0)
+    state.rov_config.regulator.yaw = AxisConfig(kp=0, ki=0, kd=0, rate=30.0)
+    state.rov_config.regulator.roll = AxisConfig(kp=0, ki=0, kd=0, rate=20.0)
+    regulator = RegulatorController(state)
+    regulator.delta_t_run_regulator = 0.5
+    regulator.desired_quaternion[:] = Rotation.from_euler(
+        "ZYX", [10.0, 75.0, -5.0], degrees=True
+    ).as_quat()
+    direction_vector = np.array([0, 0, 0, 1.0, 1.0, -1.0, 0, 0], dtype=np.float32)
+
+    regulator._update_desired_from_direction_vector(direction_vector)
+
+    expected = Rotation.from_euler("ZYX", [25.0, 80.0, -15.0], degrees=True)
+    assert np.allclose(
+        np.abs(np.dot(regulator.desired_quaternion, expected.as_quat())), 1.0
+    )
+    assert state.regulator.desired_yaw == pytest.approx(25.0, abs=1e-4)
+    assert state.regulator.desired_pitch == pytest.approx(80.0, abs=1e-4)
+    assert state.regulator.desired_roll == pytest.approx(-15.0, abs=1e-4)
+
+
+def test_update_desired_from_direction_vector_fpv_applies_body_rotation(rov_state):
+    state = rov_state
+    state.system_status.auto_stabilization = True
+    state.rov_config.regulator.fpv_mode = True
+    state.rov_config.regulator.pitch = AxisConfig(kp=0, ki=0, kd=0, rate=60.0)
+    state.rov_config.regulator.yaw = AxisConfig(kp=0, ki=0, kd=0, rate=30.0)
+    state.rov_config.regulator.roll = AxisConfig(kp=0, ki=0, kd=0, rate=20.0)
+    regulator = RegulatorController(state)
+    regulator.delta_t_run_regulator = 0.5
+    start = Rotation.from_euler("ZYX", [10.0, 20.0, -5.0], degrees=True)
+    regulator.desired_quaternion[:] = start.as_quat()
+    direction_vector = np.array([0, 0, 0, 1.0, 1.0, -1.0, 0, 0], dtype=np.float32)
+
+    regulator._update_desired_from_direction_vector(direction_vector)
+
+    expected = start * Rotation.from_rotvec([-10.0, 30.0, 15.0], degrees=True)
+    assert np.allclose(
+        np.abs(np.dot(regulator.desired_quaternion, expected.as_quat())), 1.0
+    )
+    yaw, pitch, roll = expected.as_euler("ZYX", degrees=True)
+    assert state.regulator.desired_yaw == pytest.approx(yaw, abs=1e-4)
+    assert state.regulator.desired_pitch == pytest.approx(pitch, abs=1e-4)
+    assert state.regulator.desired_roll == pytest.approx(roll, abs=1e-4)
+
+
+def test_attitude_enable_edge_levels_desired_attitude_and_keeps_yaw(rov_state):
+    regulator = RegulatorController(rov_state)
+    _set_attitude(
+        regulator.ahrs, Rotation.from_euler("ZYX", [120.0, 15.0, -20.0], degrees=True)
     )
+    regulator.integral_attitude_rad[:] = (0.1, -0.2, 0.3)
+
+    regulator._attitude_enable_edge()
+
+    expected = Rotation.from_euler("ZYX", [120.0, 0.0, 0.0], degrees=True)
+    assert np.allclose(
+        np.abs(np.dot(regulator.desired_quaternion, expected.as_quat())), 1.0
+    )
+    assert np.allclose(regulator.integral_attitude_rad, 0.0)
+
+
+def test_auto_tuning_roll_phase_drives_roll_and_holds_pitch(rov_state, monkeypatch):
+    monkeypatch.setattr("rov_firmware.regulator.toast_content", lambda **_kwargs: None)
+    state = rov_state
+    state.regulator.roll = 10.0
+    state.regulator.pitch = 2.0
+    state.rov_config.regulator.pitch = AxisConfig(kp=3.0, ki=0, kd=0)
+    regulator = RegulatorController(state)
+    regulator.auto_tuning_phase = "roll"
+    regulator.auto_tuning_step = "find_zero"
+
+    vector = regulator.handle_auto_tuning(1.0)
+
+    assert vector is not None
+    assert np.allclose(
+        vector, np.array([0, 0, 0, -3.0, 0, 0.001, 0, 0], dtype=np.float32)
+    )
+
+
+def test_auto_tuning_steps_below_zero_actuation_when_error_is_zero(
+    rov_state, monkeypatch
+):
+    monkeypatch.setattr("rov_firmware.regulator.toast_content", lambda **_kwargs: None)
+    state = rov_state
+    state.regulator.pitch = 0.0
+    regulator = RegulatorController(state)
+    regulator.auto_tuning_phase = "pitch"
+    regulator.auto_tuning_step = "find_amplitude"
+    regulator.auto_tuning_zero_actuation = 0.1
+
+    vector = regulator.handle_auto_tuning(1.0)
+
+    assert vector is not None
+    assert np.allclose(vector, np.array([0, 0, 0, 0.098, 0, 0, 0, 0], dtype=np.float32))
+
+
+def test_auto_tuning_fit_curve_step_advances_to_next_phase(rov_state, monkeypatch):
+    monkeypatch.setattr("rov_firmware.regulator.toast_content", lambda **_kwargs: None)
+    regulator = RegulatorController(rov_state)
+    regulator.auto_tuning_phase = "pitch"
+    regulator.auto_tuning_step = "fit_curve"
+    regulator.auto_tuning_sample_count = 1
+    regulator.auto_tuning_amplitude = 0.2
+
+    vector = regulator.handle_auto_tuning(1.0)
+
+    assert vector is not None
+    assert np.allclose(vector, 0.0)
+    assert regulator.auto_tuning_phase == "roll"
+    assert regulator.auto_tuning_step == "find_zero"
+    assert regulator.auto_tuning_sample_count == 0
+    assert regulator.auto_tuning_amplitude == 0.0
+
+
+def test_auto_tuning_progress_toast_is_only_resent_on_change(rov_state, monkeypatch):
+    sent = []
+    monkeypatch.setattr(
+        "rov_firmware.regulator.toast_content", lambda **kwargs: sent.append(kwargs)
+    )
+    state = rov_state
+    state.regulator.pitch = 10.0
+    regulator = RegulatorController(state)
+    regulator.auto_tuning_phase = "pitch"
+    regulator.auto_tuning_step = "find_zero"
+
+    for tick in range(10):
+        regulator.handle_auto_tuning(1.0 + tick / 30)
+    state.regulator.pitch = 0.0
+    regulator.handle_auto_tuning(1.5)
+    regulator.handle_auto_tuning(1.6)
+
+    description_keys = [toast["content"].description_key for toast in sent]
+    assert description_keys == [
+        "toasts_auto_tuning_finding_zero",
+        "toasts_auto_tuning_finding_oscillation",
+    ]
+
+
+def test_fit_curve_derives_pid_from_recorded_oscillation(rov_state):
+    regulator = RegulatorController(rov_state)
+    times = np.arange(0.0, 10.0, 1 / 60)
+    count = times.size
+    regulator.auto_tuning_times[:count] = times
+    regulator.auto_tuning_values[:count] = 8.0 * np.sin(2 * np.pi * 0.1 * times) + 1.0
+    regulator.auto_tuning_sample_count = count
+    regulator.auto_tuning_amplitude = 0.2
+
+    regulator._fit_curve("pitch")
+
+    ku = 4 * 0.2 / (np.pi * 8.0)
+    tu = 10.0
+    params = regulator.auto_tuning_params["pitch"]
+    assert params.kp == pytest.approx(0.6 * ku, rel=1e-3)
+    assert params.ki == pytest.approx(1.2 * ku / tu, rel=1e-3)
+    assert params.kd == pytest.approx(0.075 * ku * tu, rel=1e-3)
+
+
+def test_fit_curve_reads_clean_oscillation_straight_from_the_spectrum(
+    rov_state, monkeypatch
+):
+    def unexpected_curve_fit(*_args, **_kwargs):
+        pytest.fail("curve_fit should not run for a prominent peak")
+
+    monkeypatch.setattr("rov_firmware.regulator.curve_fit", unexpected_curve_fit)
+    regulator = RegulatorController(rov_state)
+    rng = np.random.default_rng(0)
+    times = np.cumsum(rng.uniform(1 / 60, 1 / 40, 400))
+    times -= times[0]
+    count = times.size
+    regulator.auto_tuning_times[:count] = times
+    regulator.auto_tuning_values[:count] = 5.0 * np.sin(2 * np.pi * 0.7 * times + 1.0)
+    regulator.auto_tuning_sample_count = count
+    regulator.auto_tuning_amplitude = 0.2
+
+    regulator._fit_curve("roll")
+
+    ku = 4 * 0.2 / (np.pi * 5.0)
+    params = regulator.auto_tuning_params["roll"]
+    # Interpolated spectral peak, accurate to a fraction of a percent
+    assert params.kp == pytest.approx(0.6 * ku, rel=1e-2)
+    assert params.kd == pytest.approx(0.075 * ku / 0.7, rel=1e-2)
+
+
+def test_fit_curve_zeroes_gains_when_too_few_samples_were_recorded(rov_state):
+    regulator = RegulatorController(rov_state)
+    regulator.auto_tuning_times[:3] = (0.0, 0.5, 1.0)
+    regulator.auto_tuning_values[:3] = (1.0, -1.0, 1.0)
+    regulator.auto_tuning_sample_count = 3
+    regulator.auto_tuning_amplitude = 0.2
+
+    regulator._fit_curve("depth")
+
+    assert regulator.auto_tuning_params["depth"] == AxisConfig(kp=0, ki=0, kd=0)
+
+
+def test_auto_tuning_oscillation_skips_repeated_depth_samples(rov_state, monkeypatch):
+    monkeypatch.setattr("rov_firmware.regulator.toast_content", lambda **_kwargs: None)
+    state = rov_state
+    state.pressure.depth = 1.2
+    state.regulator.desired_depth = 1.0
+    regulator = RegulatorController(state)
+    regulator.auto_tuning_phase = "depth"
+    regulator.auto_tuning_step = "oscillate"
+    regulator.auto_tuning_oscillation_start = 1.0
+
+    for current_time in (1.0, 1.05, 1.1):
+        regulator.handle_auto_tuning(current_time)
+    state.pressure.depth = 1.3
+    regulator.handle_auto_tuning(1.15)
+
+    count = regulator.auto_tuning_sample_count
+    assert count == 2
+    assert np.allclose(regulator.auto_tuning_times[:count], [0.0, 0.15])
+    assert np.allclose(regulator.auto_tuning_values[:count], [1.2, 1.3])
+
+
+def test_update_desired_from_direction_vector_wraps_published_yaw(rov_state):
+    state = rov_state
+    state.system_status.auto_stabilization = True
+    state.rov_config.regulator.fpv_mode = False
+    state.rov_config.regulator.yaw = AxisConfig(kp=0, ki=0, kd=0, rate=60.0)
+    regulator = RegulatorController(state)
+    regulator.delta_t_run_regulator = 0.5
+    regulator.desired_quaternion[:] = Rotation.from_euler(
+        "ZYX", [170.0, 0.0, 0.0], degrees=True
+    ).as_quat()
+    direction_vector = np.array([0, 0, 0, 0, 1.0, 0, 0, 0], dtype=np.float32)
+
+    regulator._update_desired_from_direction_vector(direction_vector)
+
+    yaw, _pitch, _roll = Rotation.from_quat(regulator.desired_quaternion).as_euler(
+        "ZYX", degrees=True
+    )
+    assert yaw == pytest.approx(-160.0, abs=1e-4)
+    assert state.regulator.desired_yaw == pytest.approx(-160.0, abs=1e-4)
+
+
+def test_combine_user_and_regulator_direction_vectors_scales_user_and_clips_regulator(
+    rov_state,
+):
+    state = rov_state
+    state.rov_config.power.thrusters_limit = 40
+    state.rov_config.power.actions_limit = 25
+    state.rov_config.power.regulator_limit = 30
+    regulator = RegulatorController(state)
+    user = np.array([1.0, -1.0, 0.5, -0.5, 0.25, -0.25, 1.0, -1.0], dtype=np.float32)
+    regulator_output = np.array(
+        [-1.0, -0.2, 0.0, 0.2, 0.6, 1.0, -0.7, 0.7], dtype=np.float32
+    )
+    direction_vector = user.copy()
+
+    unlimited = regulator._combine_user_and_regulator_direction_vectors(
+        direction_vector, regulator_output
+    )
+
+    assert np.allclose(
+        unlimited,
+        np.array([0.0, -1.2, 0.5, -0.3, 0.85, 0.75, 0.3, -0.3], dtype=np.float32),
+    )
+    assert np.allclose(
+        direction_vector,
+        np.array([0.1, -0.6, 0.2, 0.0, 0.4, 0.2, -0.05, 0.05], dtype=np.float32),
+    )
+    assert np.array_equal(
+        regulator_output,
+        np.array([-1.0, -0.2, 0.0, 0.2, 0.6, 1.0, -0.7, 0.7], dtype=np.float32),
+    )
+
+
+def test_depth_hold_actuation_uses_the_shared_movement_transform(
+    rov_state, monkeypatch
+):
+    state = rov_state
+    state.system_status.depth_hold = True
+    state.system_status.auto_stabilization = False
+    regulator = RegulatorController(state)
+    _set_attitude(
+        regulator.ahrs, Rotation.from_euler("ZYX", [30.0, 0.0, 90.0], degrees=True)
+    )
+    monkeypatch.setattr(regulator, "_handle_depth_hold", lambda _heave: 0.2)
+    expected_regulator = regulator._transform_movement_vector_world_to_body(
+        np.array([0.0, 0.0, 0.2], dtype=np.float32)
+    ).copy()
+    direction_vector = np.array(
+        [0.3, 0.4, 0.5, 0.0, 0.0, 0.0, 0.0, 0.0], dtype=np.float32
+    )
+
+    regulator.apply_regulator_to_direction_vector(direction_vector)
+
+    assert np.allclose(regulator._regulator_direction_vector[0:3], expected_regulator)
+    assert np.allclose(expected_regulator, [0.0, 0.2, 0.0], atol=1e-6)
@@ -1,5 +1,6 @@
 import asyncio
 import struct
+from types import SimpleNamespace
 from typing import Any, cast
 
 import numpy as np
@@ -353,3 +354,44 @@ def test_protocol_config_logs_actionable_error_when_ack_stays_blocked(
         "Thruster protocol change is still blocked because the MCU has not "
         "confirmed it. Check power and telemetry for every ESC."
     ]
+
+
+def test_send_loop_drives_auto_tuning_from_the_monotonic_clock(rov_state, monkeypatch):
+    class _ConnectedSerialManager(_SerialManagerSpy):
+        async def ensure_connection(self):
+            return True
+
+        def get_writer(self):
+            return _WriterSpy()
+
+    regulator = RegulatorController(rov_state)
+    thrusters = Thrusters(
+        rov_state, cast(Any, _ConnectedSerialManager()), cast(Any, regulator)
+    )
+    rov_state.regulator.auto_tuning_active = True
+    tuning_times: list[float] = []
+
+    def record_tuning_time(current_time: float) -> None:
+        tuning_times.append(current_time)
+
+    async def config_confirmed(_writer):
+        return True
+
+    async def stop_after_first_send(_writer, _thrust_values):
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(
+        thrusters_module,
+        "time",
+        SimpleNamespace(
+            time=lambda: 1000.0, monotonic=lambda: 5.0, perf_counter=lambda: 0.0
+        ),
+    )
+    monkeypatch.setattr(regulator, "handle_auto_tuning", record_tuning_time)
+    monkeypatch.setattr(thrusters, "_ensure_config_sent", config_confirmed)
+    monkeypatch.setattr(thrusters, "_send_with_retries", stop_after_first_send)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(thrusters.send_loop())
+
+    assert tuning_times == [5.0]